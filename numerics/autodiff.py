@@ -0,0 +1,268 @@
+"""
+Author  : Mehmet Gokcay Kabatas
+Mail    : mgokcaykdev@gmail.com
+Version : 0.1
+Date    : 19/10/2026
+Update  : 19/10/2026
+Python  : 3.6.5
+
+Update Note : Forward mode automatic differentiation with dual and
+              hyper-dual numbers.
+
+This script written by @Author for personal usage.
+
+Prerequest : numpy
+
+"""
+import numpy as np
+
+def _term(c, x, n):
+    """ c * x**n, zero where c equal zero (avoid 0 * inf). """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(c == 0, 0., c * x**n)
+
+# ufunc : (f, f', f'')
+_rules = {
+    np.negative : (np.negative, lambda x: -np.ones_like(x), np.zeros_like),
+    np.absolute : (np.absolute, np.sign, np.zeros_like),
+    np.square : (np.square, lambda x: 2 * x, lambda x: 2 * np.ones_like(x)),
+    np.sqrt : (np.sqrt, lambda x: 0.5 / np.sqrt(x), lambda x: -0.25 / x**1.5),
+    np.cbrt : (np.cbrt, lambda x: 1 / (3 * np.cbrt(x)**2), lambda x: -2 / (9 * np.cbrt(x)**5)),
+    np.reciprocal : (np.reciprocal, lambda x: -1 / x**2, lambda x: 2 / x**3),
+    np.exp : (np.exp, np.exp, np.exp),
+    np.expm1 : (np.expm1, np.exp, np.exp),
+    np.log : (np.log, lambda x: 1 / x, lambda x: -1 / x**2),
+    np.log2 : (np.log2, lambda x: 1 / (x * np.log(2)), lambda x: -1 / (x**2 * np.log(2))),
+    np.log10 : (np.log10, lambda x: 1 / (x * np.log(10)), lambda x: -1 / (x**2 * np.log(10))),
+    np.log1p : (np.log1p, lambda x: 1 / (1 + x), lambda x: -1 / (1 + x)**2),
+    np.sin : (np.sin, np.cos, lambda x: -np.sin(x)),
+    np.cos : (np.cos, lambda x: -np.sin(x), lambda x: -np.cos(x)),
+    np.tan : (np.tan, lambda x: 1 / np.cos(x)**2, lambda x: 2 * np.tan(x) / np.cos(x)**2),
+    np.arcsin : (np.arcsin, lambda x: 1 / np.sqrt(1 - x * x), lambda x: x / (1 - x * x)**1.5),
+    np.arccos : (np.arccos, lambda x: -1 / np.sqrt(1 - x * x), lambda x: -x / (1 - x * x)**1.5),
+    np.arctan : (np.arctan, lambda x: 1 / (1 + x * x), lambda x: -2 * x / (1 + x * x)**2),
+    np.sinh : (np.sinh, np.cosh, np.sinh),
+    np.cosh : (np.cosh, np.sinh, np.cosh),
+    np.tanh : (np.tanh, lambda x: 1 / np.cosh(x)**2, lambda x: -2 * np.tanh(x) / np.cosh(x)**2),
+}
+
+class Dual():
+    """
+    This class written for dual numbers, a + b e where e^2 = 0. Function
+    evaluated with Dual(x, 1) gives f(x) + f'(x) e, so value and exact
+    derivative found with one evaluation. Parts can be numpy arrays, then
+    derivatives of all elements found together. Arithmetic operators and
+    numpy ufuncs (sin, exp, log, sqrt ...) are supported. Math module
+    functions are not supported, numpy functions should be used.
+
+    Arguments :
+        -------------
+        value = real part.
+
+        der = dual (derivative) part. Default is 0.
+
+        @Usage :
+        ...
+        def f(x):
+            return np.sin(x) * x**2
+
+        y = f(Dual(x, 1.))
+        y.value, y.der
+        ...
+
+    """
+    __array_priority__ = 100
+
+    def __init__(self, value, der=0.):
+        self.value = value
+        self.der = der
+
+    def _parts(self):
+        return (self.value, self.der)
+
+    @classmethod
+    def _lift(cls, other):
+        if isinstance(other, Dual):
+            if type(other) is not cls:
+                raise TypeError("Dual and HyperDual numbers cannot be mixed.")
+            return other
+        return cls(other, *[0.] * (len(cls(0.)._parts()) - 1))
+
+    def _chain(self, f, df, ddf):
+        return Dual(f(self.value), df(self.value) * self.der)
+
+    def _mul(self, other):
+        return Dual(self.value * other.value,
+                    self.value * other.der + self.der * other.value)
+
+    def __add__(self, other):
+        other = self._lift(other)
+        return type(self)(*[a + b for a, b in zip(self._parts(), other._parts())])
+
+    def __sub__(self, other):
+        other = self._lift(other)
+        return type(self)(*[a - b for a, b in zip(self._parts(), other._parts())])
+
+    def __mul__(self, other):
+        if not isinstance(other, Dual):
+            return type(self)(*[a * other for a in self._parts()])
+        return self._mul(self._lift(other))
+
+    def __truediv__(self, other):
+        if not isinstance(other, Dual):
+            return type(self)(*[a / other for a in self._parts()])
+        return self * self._lift(other)._chain(*_rules[np.reciprocal])
+
+    def __pow__(self, other):
+        if isinstance(other, Dual):
+            return np.exp(other * np.log(self))
+        n = other
+        return self._chain(lambda x: x**n, lambda x: _term(n, x, n - 1),
+                           lambda x: _term(n * (n - 1), x, n - 2))
+
+    def __radd__(self, other):
+        return self + other
+
+    def __rsub__(self, other):
+        return -self + other
+
+    def __rmul__(self, other):
+        return self * other
+
+    def __rtruediv__(self, other):
+        return self._chain(*_rules[np.reciprocal]) * other
+
+    def __rpow__(self, other):
+        return np.exp(self * np.log(other))
+
+    def __neg__(self):
+        return type(self)(*[-a for a in self._parts()])
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return np.absolute(self)
+
+    # comparisons use real parts
+    def __lt__(self, other):
+        return self.value < self._lift(other).value
+
+    def __le__(self, other):
+        return self.value <= self._lift(other).value
+
+    def __gt__(self, other):
+        return self.value > self._lift(other).value
+
+    def __ge__(self, other):
+        return self.value >= self._lift(other).value
+
+    def __getitem__(self, index):
+        return type(self)(*[np.asarray(a)[index] if np.ndim(a) else a
+                            for a in self._parts()])
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != '__call__' or kwargs:
+            return NotImplemented
+        if ufunc in _rules and len(inputs) == 1:
+            return inputs[0]._chain(*_rules[ufunc])
+        binary = {np.add : lambda a, b: a + b, np.subtract : lambda a, b: a - b,
+                  np.multiply : lambda a, b: a * b, np.true_divide : lambda a, b: a / b,
+                  np.power : lambda a, b: a**b}
+        if ufunc in binary and len(inputs) == 2:
+            a, b = inputs
+            if not isinstance(a, Dual):
+                a = b._lift(a)
+            return binary[ufunc](a, b)
+        return NotImplemented
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__,
+                               ", ".join(repr(a) for a in self._parts()))
+
+class HyperDual(Dual):
+    """
+    This class written for hyper-dual numbers, a + b e1 + c e2 + d e1e2
+    where e1^2 = e2^2 = 0. Function evaluated with HyperDual(x, 1, 1, 0)
+    gives f(x), f'(x) (e1 and e2 parts) and f''(x) (e1e2 part) exactly with
+    one evaluation.
+
+    Arguments :
+        -------------
+        value = real part.
+
+        der = e1 part. Default is 0.
+
+        der2 = e2 part. Default is 0.
+
+        der12 = e1e2 part. Default is 0.
+
+        @Usage :
+        ...
+        y = f(HyperDual(x, 1., 1., 0.))
+        f, df, ddf = y.value, y.der, y.der12
+        ...
+
+    """
+    def __init__(self, value, der=0., der2=0., der12=0.):
+        self.value = value
+        self.der = der
+        self.der2 = der2
+        self.der12 = der12
+
+    def _parts(self):
+        return (self.value, self.der, self.der2, self.der12)
+
+    def _chain(self, f, df, ddf):
+        d = df(self.value)
+        return HyperDual(f(self.value), d * self.der, d * self.der2,
+                         d * self.der12 + ddf(self.value) * self.der * self.der2)
+
+    def _mul(self, other):
+        return HyperDual(self.value * other.value,
+                         self.value * other.der + self.der * other.value,
+                         self.value * other.der2 + self.der2 * other.value,
+                         self.value * other.der12 + self.der * other.der2
+                         + self.der2 * other.der + self.der12 * other.value)
+
+def derivative(func, x):
+    """
+    This function return value and exact first derivative of function
+    with one evaluation using dual numbers.
+
+    Arguments :
+    -------------
+        func = function which written with operators and numpy functions.
+
+        x = point(s) which derivative found. Can be array.
+
+    Return :
+    --------
+            f(x), f'(x)
+    """
+    y = func(Dual(x, np.ones_like(x, dtype=np.float64)))
+    if not isinstance(y, Dual):
+        return y, np.zeros_like(y, dtype=np.float64)
+    return y.value, y.der
+
+def secondDerivative(func, x):
+    """
+    This function return value, exact first and second derivatives of
+    function with one evaluation using hyper-dual numbers.
+
+    Arguments :
+    -------------
+        func = function which written with operators and numpy functions.
+
+        x = point(s) which derivatives found. Can be array.
+
+    Return :
+    --------
+            f(x), f'(x), f''(x)
+    """
+    one = np.ones_like(x, dtype=np.float64)
+    y = func(HyperDual(x, one, one, 0. * one))
+    if not isinstance(y, HyperDual):
+        zero = np.zeros_like(y, dtype=np.float64)
+        return y, zero, zero
+    return y.value, y.der, y.der12
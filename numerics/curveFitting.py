@@ -3,20 +3,209 @@ Author  : Mehmet Gokcay Kabatas
 Mail    : mgokcaykdev@gmail.com
 Version : 0.1
 Date    : 11/12/2019
-Update  : 01/02/2021
+Update  : 19/10/2026
 Python  : 3.6.5
 
-Update Note : Assign dtype of arrays to np.float64 to handle some overflows.
+Update Note : PolynomialRegression computed with vectorized design matrix 
+              and QR/SVD least-squares. Adding predict.
+              Adding mergeable accumulators for Linear and Exponential 
+              Regression. MultipleLinearRegression rewritten for any 
+              number of predictors with chunked (out-of-core) processing.
+              Adding batched Linear, Polynomial and Exponential Regression.
+              Adding RollingRegression. Adding NewtonInterpolation, 
+              BarycentricInterpolation, LinearSpline and CubicSpline 
+              classes. Adding NonlinearRegression (Levenberg-Marquardt).
+              Adding OrthogonalPolynomialRegression, 
+              PolynomialOrderSelection and SparseRegression. Adding 
+              RegularGridInterpolation and RBFInterpolation.
 
 This script written by @Author for personal usage. 
 
-Prerequest : numpy
+Prerequest : numpy, scipy (only for RBFInterpolation)
 
 """
 
 from numerics.tool import *
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from math import factorial
 import numpy as np
 
+class LinearRegressionAccumulator():
+    """
+    This class written for online (streaming) Linear Regression application. 
+    Data is reduced to count, means and co-moments chunk by chunk with 
+    vectorized sums and numerically stable (Welford/Chan) update, so 
+    regression can be updated with new data without rescanning old data 
+    and accumulators of different shards can be merged.
+
+    \n Class has 4 methods. \n
+        - partial_fit(xValues, yValues) : Add chunk of data.
+        - merge(other) : Add statistics of other accumulator.
+        - finalize() : Return of coefficient.
+        - standartErrorEstimate() : Return of error estimate.
+
+        @Usage :
+        ...
+        acc = LinearRegressionAccumulator()
+        for x, y in chunks:
+            acc.partial_fit(x, y)
+        acc.merge(otherAcc)
+        a1, a0 = acc.finalize()
+        ...
+
+    """
+    def __init__(self):
+        self._n = 0
+        self._meanX = 0.
+        self._meanY = 0.
+        self._Sxx = 0.
+        self._Syy = 0.
+        self._Sxy = 0.
+
+    def _transform(self, xValues, yValues):
+        return (np.asarray(xValues, dtype=np.float64).ravel(), 
+                np.asarray(yValues, dtype=np.float64).ravel())
+
+    def __combine(self, n, meanX, meanY, Sxx, Syy, Sxy):
+        if n == 0:
+            return
+        total = self._n + n
+        dX = meanX - self._meanX
+        dY = meanY - self._meanY
+        f = self._n * n / total
+        self._meanX += dX * n / total
+        self._meanY += dY * n / total
+        self._Sxx += Sxx + dX * dX * f
+        self._Syy += Syy + dY * dY * f
+        self._Sxy += Sxy + dX * dY * f
+        self._n = total
+
+    def partial_fit(self, xValues, yValues):
+        """
+        This function add chunk of data to accumulator.
+
+        Arguments :
+        -------------
+            xValues = x values of chunk.
+
+            yValues = y values of chunk.
+
+        Return :
+        --------
+                Accumulator itself.
+        """
+        x, y = self._transform(xValues, yValues)
+        if len(x) != len(y):
+            raise Exception("Length of x and y should be same.")
+        if len(x) == 0:
+            return self
+        meanX, meanY = x.mean(), y.mean()
+        dx, dy = x - meanX, y - meanY
+        self.__combine(len(x), meanX, meanY, np.dot(dx, dx), np.dot(dy, dy), np.dot(dx, dy))
+        return self
+
+    def merge(self, other):
+        """
+        This function add statistics of other accumulator, ex: accumulator 
+        of other shard of data.
+
+        Arguments :
+        -------------
+            other = other accumulator.
+
+        Return :
+        --------
+                Accumulator itself.
+        """
+        self.__combine(other._n, other._meanX, other._meanY, other._Sxx, other._Syy, other._Sxy)
+        return self
+
+    def finalize(self):
+        """
+        This function return coefficient of Linear Regression.
+
+        Return :
+        --------
+                Return will be two coefficients which are a1 and a0.
+                f(x) = a0 + a1x
+        """
+        if self._n < 2:
+            raise Exception("Regression need at least 2 data points.")
+        a1 = self._Sxy / self._Sxx
+        a0 = self._meanY - a1 * self._meanX
+        return a1, a0
+
+    def standartErrorEstimate(self):
+        """
+        This function return error estimate (correlation coefficient) of 
+        Linear Regression.
+
+        Return :
+        --------
+                Return will be value of error of Linear Regression.
+        """
+        return self._Sxy / (self._Sxx * self._Syy) ** (0.5)
+
+
+
+class ExponentialRegressionAccumulator(LinearRegressionAccumulator):
+    """
+    This class written for online (streaming) Exponential Regression 
+    application. Same as LinearRegressionAccumulator applied to log of y.
+
+    Arguments :
+        -------------
+        mode = Type of exponential.
+
+            exp = A*exp(Bx)
+
+            nexp = A*B^(x)
+
+        @Usage :
+        ...
+        acc = ExponentialRegressionAccumulator('exp')
+        for x, y in chunks:
+            acc.partial_fit(x, y)
+        A, B = acc.finalize()
+        ...
+
+    """
+    def __init__(self, mode='exp'):
+        super().__init__()
+        self._mode = mode.lower()
+
+    def _transform(self, xValues, yValues):
+        return (np.asarray(xValues, dtype=np.float64).ravel(), 
+                np.log(np.asarray(yValues, dtype=np.float64)).ravel())
+
+    def finalize(self):
+        """
+        This function return coefficient of Exponential Regression.
+
+        Return :
+        --------
+                Return will be two coefficients which are A and B.
+    
+                for mode 'exp' :
+                    
+                    f(x) = A * exp(Bx)
+
+                for mode 'nexp' :
+
+                    f(x) = A * B^(x)
+        """
+        a1, a0 = super().finalize()
+        A = np.exp(a0)
+        if self._mode == 'exp':
+            B = a1
+        else:
+            B = np.exp(a1)
+        return A, B
+
+
+
 class LinearRegression():
     """
     This class written for numerical methods for Linear Regression application. 
@@ -47,17 +236,7 @@ class LinearRegression():
         self.__compute()
 
     def __compute(self):
-        self._sumX = 0 
-        self._sumY = 0
-        self._sumXY = 0
-        self._sumXSq = 0
-        self._sumYSq = 0
-        for itemX, itemY in zip(self._xValues, self._yValues):
-            self._sumX += itemX
-            self._sumY += itemY
-            self._sumXY += itemX * itemY
-            self._sumXSq += itemX ** 2
-            self._sumYSq += itemY ** 2
+        self._acc = LinearRegressionAccumulator().partial_fit(self._xValues, self._yValues)
 
     def results(self):
         """
@@ -74,10 +253,7 @@ class LinearRegression():
             a1, a0 = cf.results()
             ...
         """
-        a1 = self._n * self._sumXY - self._sumX * self._sumY
-        a1 /= self._n * self._sumXSq - self._sumX **2
-        a0 = arithmaticMean(self._yValues) - a1 * arithmaticMean(self._xValues)        
-        return a1, a0
+        return self._acc.finalize()
 
     def standartErrorEstimate(self):
         """
@@ -93,10 +269,7 @@ class LinearRegression():
             error  = cf.standartErrorEstimate()
             ...
         """
-        r = self._n * self._sumXY - self._sumX * self._sumY
-        div = (self._n * self._sumXSq - self._sumX ** 2) ** (0.5) * (self._n * self._sumYSq - self._sumY ** 2) ** (0.5)
-        r /= div
-        return r
+        return self._acc.standartErrorEstimate()
 
 
 
@@ -105,11 +278,32 @@ class MultipleLinearRegression():
     This class written for numerical methods for Multiple Linear Regression application. 
     \n y = a0 + a1x1 + a2x2 + ...
 
+    Normal equations (X^T X and X^T y) accumulated chunk by chunk and 
+    solved with Cholesky decomposition, so data can be bigger than memory 
+    when it given as memory-mapped array, `.npy` file or CSV file.
+
     Arguments :
     ----------
-        xValues = x values of curve fitting data.
+        xValues = x values of curve fitting data. Can be array, 
+        memory-mapped array, path of `.npy` file or path of CSV file.
 
-        yValues = y values of curve fitting data.
+        yValues = y values of curve fitting data. Can be array, 
+        memory-mapped array or path of `.npy` file. Should be None if 
+        xValues is CSV file, each row of CSV file is a data point and 
+        last column is y values.
+
+        chunkSize = number of data points processed at once. Default 
+        is 2^16.
+
+        workers = number of threads which process chunks. Default is 1.
+
+        sampleAxis = axis of xValues which data points lie on. Default 
+        is 1 which means xValues = [x1, x2, ...]. For tables which each 
+        row is a data point, it should be 0.
+
+        skipRows = number of header rows of CSV file. Default is 0.
+
+        delimiter = delimiter of CSV file. Default is ','.
 
         @Note : x values should be array. \n 
         Ex : 
@@ -117,9 +311,15 @@ class MultipleLinearRegression():
             x2 = [0, 1, 2, 3, 6, 2]
             cf = MultipleLinearRegression([x1,x2],y)
 
+            X = np.load('x.npy', mmap_mode='r')     # shape (n, p)
+            cf = MultipleLinearRegression(X, 'y.npy', sampleAxis=0, workers=4)
+
+            cf = MultipleLinearRegression('data.csv', skipRows=1)
+
     
-    \n Class has 1 methods. \n
+    \n Class has 2 methods. \n
         - results() : Return of coefficient.
+        - predict(x) : Return of values of fitted function at x.
 
         @Usage :
         ...
@@ -128,8 +328,99 @@ class MultipleLinearRegression():
         ...
 
     """
-    def __init__(self, xValues, yValues):
-        self.res = PolynomialRegression(xValues,yValues,2)
+    def __init__(self, xValues, yValues=None, chunkSize=2**16, workers=1, 
+                 sampleAxis=1, skipRows=0, delimiter=','):
+        self._chunkSize = int(chunkSize)
+        self._workers = max(int(workers), 1)
+        self._sampleAxis = sampleAxis
+        if isinstance(xValues, str) and yValues is None:
+            self._sampleAxis = 0
+            loaders = self.__csvChunks(xValues, skipRows, delimiter)
+        else:
+            loaders = self.__arrayChunks(xValues, yValues)
+        self.__compute(loaders)
+
+    def __load(self, values):
+        if isinstance(values, str):
+            return np.load(values, mmap_mode='r')
+        if isinstance(values, np.ndarray):
+            return values
+        return np.asarray(values, dtype=np.float64)
+
+    def __arrayChunks(self, xValues, yValues):
+        x, y = self.__load(xValues), self.__load(yValues)
+        if x.ndim == 1:
+            x = x.reshape((1, -1) if self._sampleAxis == 1 else (-1, 1))
+        n = len(y)
+        if x.shape[self._sampleAxis] != n:
+            raise Exception("Number of x and y values should be same.")
+        cs = self._chunkSize
+        for i in range(0, n, cs):
+            if self._sampleAxis == 1:
+                yield lambda i=i: (np.asarray(x[:, i:i + cs], dtype=np.float64).T,
+                                   np.asarray(y[i:i + cs], dtype=np.float64))
+            else:
+                yield lambda i=i: (np.asarray(x[i:i + cs], dtype=np.float64),
+                                   np.asarray(y[i:i + cs], dtype=np.float64))
+
+    def __csvChunks(self, path, skipRows, delimiter):
+        with open(path) as f:
+            for i in range(skipRows):
+                next(f)
+            while True:
+                lines = list(islice(f, self._chunkSize))
+                if len(lines) == 0:
+                    break
+                data = np.loadtxt(lines, delimiter=delimiter, ndmin=2)
+                yield lambda data=data: (data[:, :-1], data[:, -1])
+
+    def __partial(self, loader):
+        X, y = loader()
+        X = np.column_stack((np.ones(len(y)), X - self._shift))
+        return X.T @ X, X.T @ y
+
+    def __compute(self, loaders):
+        loaders = iter(loaders)
+        first = next(loaders, None)
+        if first is None:
+            raise Exception("Regression cannot process, there is no data.")
+        # Predictors shifted by mean of first chunk to improve conditioning
+        # of normal equations.
+        X, y = first()
+        self._shift = X.mean(axis=0)
+        self._XtX, self._Xty = self.__partial(lambda: (X, y))
+        if self._workers == 1:
+            for loader in loaders:
+                XtX, Xty = self.__partial(loader)
+                self._XtX += XtX
+                self._Xty += Xty
+        else:
+            with ThreadPoolExecutor(self._workers) as executor:
+                pending = deque()
+                for loader in loaders:
+                    pending.append(executor.submit(self.__partial, loader))
+                    if len(pending) >= 2 * self._workers:
+                        XtX, Xty = pending.popleft().result()
+                        self._XtX += XtX
+                        self._Xty += Xty
+                for future in pending:
+                    XtX, Xty = future.result()
+                    self._XtX += XtX
+                    self._Xty += Xty
+        self._n = int(round(self._XtX[0][0]))
+        try:
+            L = np.linalg.cholesky(self._XtX)
+        except np.linalg.LinAlgError:
+            raise Exception("Regression cannot process, predictors are linearly dependent or number of data not enough.")
+        # forward and back substitution with Cholesky factor.
+        p = len(self._Xty)
+        z = np.empty(p)
+        for i in range(p):
+            z[i] = (self._Xty[i] - L[i, :i] @ z[:i]) / L[i, i]
+        self._a = np.empty(p)
+        for i in range(p - 1, -1, -1):
+            self._a[i] = (z[i] - L[i + 1:, i] @ self._a[i + 1:]) / L[i, i]
+        self._a[0] -= self._a[1:] @ self._shift
 
     def results(self):
         """
@@ -147,7 +438,34 @@ class MultipleLinearRegression():
             coeff = cf.results()
             ...
         """
-        return self.res.results()
+        return self._a
+
+    def predict(self, x):
+        """
+        This function return values of fitted function.
+
+        Arguments :
+        -------------
+            x = x values which function evaluated. Should be in same 
+            layout with xValues (w.r.t sampleAxis). For CSV data, each 
+            row should be a data point.
+
+        Return :
+        --------
+                Return will be array of values.
+
+            @Usage :
+            ...
+            cf = MultipleLinearRegression(xValues, yValues)
+            y = cf.predict([x1, x2])
+            ...
+        """
+        x = np.asarray(x, dtype=np.float64)
+        if x.ndim == 1:
+            x = x.reshape((1, -1) if self._sampleAxis == 1 else (-1, 1))
+        if self._sampleAxis == 1:
+            return self._a[0] + self._a[1:] @ x
+        return self._a[0] + x @ self._a[1:]
 
 
 
@@ -164,56 +482,56 @@ class PolynomialRegression():
 
         order = Order of polynomial regression approach.
 
-    \n Class has 1 methods. \n
+        solver = Least-squares solver of design matrix. 'qr' or 'svd'.
+        Default is 'qr'.
+
+        scale = Scale columns of design matrix to unit norm before solving 
+        to improve conditioning. Default is True.
+
+    \n Class has 2 methods. \n
         - results() : Return of coefficient.
+        - predict(x) : Return of values of fitted polynomial at x.
 
         @Usage :
         ...
         cf = PolynomialRegression(xValues, yValues, order)
         coeff = cf.results()
+        y = cf.predict(x)
         ...
 
     """
-    def __init__(self, xValues, yValues, order):
+    def __init__(self, xValues, yValues, order, solver='qr', scale=True):
         self._xValues = np.array(xValues, dtype=np.float64)
         self._yValues = np.array(yValues, dtype=np.float64)
         self._n = len(self._yValues)
         self._order = order
+        self._solver = solver.lower()
+        self._scale = scale
         if self._n < order + 1:
             print("Regression cannot process, check order or number of data not enough.")
         else:
             self.__compute()
 
+    def _designMatrix(self, x):
+        if x.ndim > 1:
+            return np.column_stack((np.ones(x.shape[1]), x[:self._order].T))
+        return np.vander(x, self._order + 1, increasing=True)
+
     def __compute(self):
-        self._A = np.empty((self._order + 1,self._order + 1))
-        self._B = np.empty((self._order + 1))
-        for i in range(self._order + 1):
-            for j in range(i+1):
-                k = i + j 
-                sum = 0
-                for l in range(self._n):
-                    if (self._xValues.ndim > 1):
-                        if j > 0:
-                            sum += self._xValues[i-1][l] * self._xValues[j-1][l]
-                        else:
-                            sum += self._xValues[i-1][l]
-                    else:
-                        sum += self._xValues[l] ** k
-                self._A[i][j] = sum
-                self._A[j][i] = sum
-                if (i == 0 and j == 0):
-                    self._A[i][j] = self._n
-            sumB = 0
-            for l in range(self._n):
-                if (self._xValues.ndim > 1):
-                    if i == 0:
-                        sumB += self._yValues[l]
-                    else:
-                        sumB += self._xValues[i-1][l] * self._yValues[l]
-                else:
-                    sumB += self._xValues[l] ** i * self._yValues[l]
-            self._B[i] = sumB
-        self._a = np.matmul(self._B, np.linalg.inv(self._A))
+        A = self._designMatrix(self._xValues)
+        if self._scale:
+            norm = np.linalg.norm(A, axis=0)
+            norm[norm == 0] = 1
+            A = A / norm
+        if self._solver == 'qr':
+            Q, R = np.linalg.qr(A)
+            self._a = np.linalg.solve(R, Q.T @ self._yValues)
+        elif self._solver == 'svd':
+            self._a = np.linalg.lstsq(A, self._yValues, rcond=None)[0]
+        else:
+            raise Exception("Solver should be 'qr' or 'svd'.")
+        if self._scale:
+            self._a /= norm
     
     def results(self):
         """
@@ -222,138 +540,199 @@ class PolynomialRegression():
         Return :
         --------
                 Return will be array of coefficients.
+                f(x) = a0 + a1x + a2x^2 + ...
         
 
             @Usage :
             ...
-            cf = LineraRegression(xValues, yValues)
+            cf = PolynomialRegression(xValues, yValues, order)
             coeff = cf.results()
             ...
         """
         return self._a
 
+    def predict(self, x):
+        """
+        This function return values of fitted polynomial with Horner 
+        evaluation.
 
+        Arguments :
+        -------------
+            x = x values which polynomial evaluated. For multiple 
+            regression, x should be array of predictors like xValues.
 
-class Interpolation():
-    """
-    This class written for numerical methods interpolation.
-
-        @Methods :
-        - Linear Interpolation
-        - Newton Polynomial Interpolation
-        - Linear Splines
-
-        @Usage :
-        ...
-        interpolate = Interpolation()
-        interpolate.@Methods(arguments..)
-        ...
-    """
-
+        Return :
+        --------
+                Return will be array of values.
 
-    def LinearInterpolation(self, pt1, pt2, value, func):
+            @Usage :
+            ...
+            cf = PolynomialRegression(xValues, yValues, order)
+            y = cf.predict(x)
+            ...
         """
-            This function calculate value of Linear Interpolation w.r.t func.
+        x = np.asarray(x, dtype=np.float64)
+        if self._xValues.ndim > 1:
+            return self._a[0] + self._a[1:] @ x[:self._order]
+        y = np.full(x.shape, self._a[-1])
+        for coeff in self._a[-2::-1]:
+            y *= x
+            y += coeff
+        return y
 
-            Arguments :
-            -------------
-                pt1 = first point of interpolation.
 
-                pt2 = second point of interpolation.
 
-                value = target value of function. f(value)= ?
+class OrthogonalPolynomialRegression():
+    """
+    This class written for Polynomial Regression with orthogonal 
+    (Chebyshev or Legendre) polynomials which stays well-conditioned at 
+    high order. x values mapped to [-1, 1], basis built with three-term 
+    recurrence vectorized over data and least-squares problem solved with 
+    QR which updated chunk by chunk, so memory does not depend on number 
+    of data. Values evaluated with Clenshaw recurrence.
 
-                func = target function.
+    Arguments :
+        -------------
+        xValues = x values of curve fitting data.
 
-            Return :
-            --------
-                Value of interpolated function.        
+        yValues = y values of curve fitting data.
 
-                @Usage :
-                ...
-                cf = Interpolation()
-                y = cf.LinearInterpolation(pt1,pt2,value,func)   
-                ...
-        """
-        res = func(pt1) + (func(pt2) - func(pt1)) 
-        res /= (pt2 - pt1) * (value - pt1)
-        return res
+        order = Order of polynomial regression approach.
 
-    def NewtonPolynomialInterpolation(self, x, y, value, order):
-        """
-            This function calculate value of Newton Polynomial Interpolation.
+        basis = Type of polynomials. 'chebyshev' or 'legendre'. 
+        Default is 'chebyshev'.
 
-            Arguments :
-            -------------
-                x = x values of data.
+        domain = (a, b) interval which mapped to [-1, 1]. Default is 
+        (min(xValues), max(xValues)).
 
-                y = y values of data.
+        chunkSize = number of data points processed at once. Default 
+        is 2^16.
 
-                valeu = targer value of function. f(value)=?
+    \n Class has 2 methods. \n
+        - results() : Return of coefficient of each basis polynomial.
+        - predict(x) : Return of values of fitted polynomial at x.
 
-                order = order of interpolation.
+        @Usage :
+        ...
+        cf = OrthogonalPolynomialRegression(xValues, yValues, 60)
+        coeff = cf.results()     # f(x) = c0 T0(t) + c1 T1(t) + ...
+        y = cf.predict(x)
+        ...
 
-            Return :
-            --------
-                Value of interpolated function and estimated error.        
+    """
+    def __init__(self, xValues, yValues, order, basis='chebyshev', domain=None, chunkSize=2**16):
+        self._xValues = np.asarray(xValues, dtype=np.float64)
+        self._yValues = np.asarray(yValues, dtype=np.float64)
+        self._n = len(self._yValues)
+        self._order = order
+        self._basis = basis.lower()
+        self._chunkSize = int(chunkSize)
+        if self._basis not in ('chebyshev', 'legendre'):
+            raise Exception("basis should be 'chebyshev' or 'legendre'.")
+        if domain is None:
+            domain = (self._xValues.min(), self._xValues.max())
+        self._domain = domain
+        if self._n < order + 1:
+            print("Regression cannot process, check order or number of data not enough.")
+        else:
+            self.__compute()
 
-                @Usage :
-                ...
-                cf = Interpolation()
-                y, err = cf.NewtonPolynomialInterpolation(x, y, value, order)
-                ...
-        """
-        fdd = np.empty((order,order))
-        for i in range(order):
-            fdd[i][0] = y[i]
-        for j in range(1,order):
-            for i in range(order-j):
-                fdd[i][j] = (fdd[i+1][j-1] - fdd[i][j-1]) / (x[i+j]-x[i])
-        xterm = 1
-        yint = np.array([])
-        ea = np.empty((order,1))
-        yint = np.append(yint,fdd[0][0])
-        for ord in range(1,order):
-            xterm = xterm * (value - x[ord-1])
-            yint2 = yint[ord-1] + fdd[0][ord] * xterm
-            ea[ord-1] = yint2 - yint[ord-1]
-            yint= np.append(yint,yint2)
-        return yint[-1], ea[-1]
+    def _map(self, x):
+        a, b = self._domain
+        if b == a:
+            return x - a
+        return (2 * x - (a + b)) / (b - a)
+
+    def _recurrence(self, k):
+        # phi_(k+1) = alpha_k * t * phi_k + beta_k * phi_(k-1)
+        if self._basis == 'chebyshev':
+            return (1. if k == 0 else 2.), -1.
+        return (2 * k + 1) / (k + 1), -k / (k + 1)
+
+    def _designMatrix(self, t):
+        # Built row by row of transpose to keep memory access contiguous.
+        A = np.empty((self._order + 1, len(t)))
+        A[0] = 1.
+        if self._order > 0:
+            A[1] = t
+        for k in range(1, self._order):
+            alpha, beta = self._recurrence(k)
+            np.multiply(t, A[k], out=A[k + 1])
+            A[k + 1] *= alpha
+            A[k + 1] += beta * A[k - 1]
+        return A.T
 
-    def LinearSplines(self, x, y, value):
+    def __compute(self):
+        # R factor of [A | y] updated with each chunk, its last column 
+        # holds Q^T y, so Q never formed.
+        m = self._order + 1
+        R = np.empty((0, m + 1))
+        for i in range(0, self._n, self._chunkSize):
+            A = self._designMatrix(self._map(self._xValues[i:i + self._chunkSize]))
+            Ay = np.column_stack((A, self._yValues[i:i + self._chunkSize]))
+            R = np.linalg.qr(np.vstack((R, Ay)), mode='r')[:m + 1]
+        self._a = np.linalg.solve(R[:m, :m], R[:m, m])
+
+    def results(self):
         """
-            This function calculate value of Linear Spline Interpolation approach.
+        This function return coefficient of each basis polynomial of 
+        regression w.r.t t which is x mapped from domain to [-1, 1].
 
-            Arguments :
-            -------------
-                x = x values of data.
+        Return :
+        --------
+                Return will be array of coefficients.
+                f(x) = c0 P0(t) + c1 P1(t) + c2 P2(t) + ...
 
-                y = y values of data.
+            @Usage :
+            ...
+            cf = OrthogonalPolynomialRegression(xValues, yValues, order)
+            coeff = cf.results()
+            ...
+        """
+        return self._a
 
-                valeu = targer value of function. f(value)=?
+    def predict(self, x):
+        """
+        This function return values of fitted polynomial with Clenshaw 
+        recurrence.
 
+        Arguments :
+        -------------
+            x = x values which polynomial evaluated.
 
-            Return :
-            --------
-                Value of interpolated function.     
+        Return :
+        --------
+                Return will be array of values.
 
-                @Usage :
-                ...
-                cf = Interpolation()
-                y, err = cf.LinearSplines(x, y, value)
-                ...
+            @Usage :
+            ...
+            cf = OrthogonalPolynomialRegression(xValues, yValues, order)
+            y = cf.predict(x)
+            ...
         """
-        for item in reversed(x):
-            if item < value:
-                ind  = x.index(item)
-                m = (y[ind + 1] - y[ind]) / (x[ind + 1] - x[ind])
-                res = y[ind] + m * (value - x[ind])
-                return res
+        t = self._map(np.asarray(x, dtype=np.float64))
+        c = self._a
+        b1 = np.zeros(t.shape)
+        b2 = np.zeros(t.shape)
+        for k in range(len(c) - 1, 0, -1):
+            alpha, _ = self._recurrence(k)
+            _, beta = self._recurrence(k + 1)
+            b1, b2 = c[k] + alpha * t * b1 + beta * b2, b1
+        _, beta = self._recurrence(1)
+        return c[0] + t * b1 + beta * b2
 
 
-class ExponentialRegression():
+
+class PolynomialOrderSelection():
     """
-    This class written for numerical methods for Exponential Regression application. 
+    This class written for selecting order of Polynomial Regression. 
+
+    Design matrix of highest order factorized once with QR, fit of every 
+    lower order read from leading columns of same factorization since 
+    models are nested. Leave-one-out error computed in closed form from 
+    diagonal of hat matrix, and k-fold cross validation folds factorized 
+    once each and run in parallel threads. Chebyshev basis used for design 
+    matrix to keep it well-conditioned.
 
     Arguments :
         -------------
@@ -361,50 +740,1450 @@ class ExponentialRegression():
 
         yValues = y values of curve fitting data.
 
-        mode = Type of exponential.
+        maxOrder = highest order which tested.
 
-            exp = A*exp(Bx)
+        criterion = criterion which order selected with. 'cv' (k-fold 
+        cross validation), 'loo' (leave-one-out), 'aic' or 'bic'. 
+        Default is 'cv'.
 
-            nexp = A*B^(x)
+        folds = number of folds of cross validation. Default is 5.
 
-    
-    \n Class has 1 methods. \n
-        - results() : Return of coefficient.
+        workers = number of threads which process folds. Default is 1.
+
+        seed = seed of random split of folds. Default is 0.
+
+        basis = basis of returned model. 'monomial' returns 
+        PolynomialRegression, 'chebyshev' returns 
+        OrthogonalPolynomialRegression. Default is 'monomial'.
+
+    \n Class has 3 methods. \n
+        - results() : Return of selected order.
+        - scores() : Return of criteria of each order.
+        - model() : Return of regression of selected order.
 
         @Usage :
         ...
-        cf = ExponentialRegression(xValues, yValues, mode)
-        A, B = cf.results()
+        sel = PolynomialOrderSelection(xValues, yValues, 20, 'cv', workers=4)
+        order = sel.results()
+        curves = sel.scores()        # curves['cv'][order]
+        cf = sel.model()
         ...
 
     """
-    def __init__(self, xValues, yValues, mode='exp'):
-        self._xValues = xValues
-        self._yValues = np.log(yValues, dtype=np.float64)
-        self._mode = mode.lower()
-        self._n = len(xValues)
+    def __init__(self, xValues, yValues, maxOrder, criterion='cv', folds=5, 
+                 workers=1, seed=0, basis='monomial'):
+        self._xValues = np.asarray(xValues, dtype=np.float64)
+        self._yValues = np.asarray(yValues, dtype=np.float64)
+        self._n = len(self._yValues)
+        self._maxOrder = maxOrder
+        self._criterion = criterion.lower()
+        self._folds = folds
+        self._workers = max(int(workers), 1)
+        self._seed = seed
+        self._basis = basis.lower()
+        if self._criterion not in ('cv', 'loo', 'aic', 'bic'):
+            raise Exception("criterion should be 'cv', 'loo', 'aic' or 'bic'.")
+        if self._n < maxOrder + 2:
+            raise Exception("Number of data is not enough for maximum order.")
         self.__compute()
 
+    def __design(self, x):
+        a, b = self._xValues.min(), self._xValues.max()
+        t = (2 * x - (a + b)) / (b - a) if b > a else x - a
+        A = np.empty((self._maxOrder + 1, len(x)))
+        A[0] = 1.
+        if self._maxOrder > 0:
+            A[1] = t
+        for k in range(1, self._maxOrder):
+            A[k + 1] = 2 * t * A[k] - A[k - 1]
+        return A.T
+
+    def __foldErrors(self, train, test):
+        # squared validation error of every order from one factorization.
+        Q, R = np.linalg.qr(self.__design(self._xValues[train]))
+        qy = Q.T @ self._yValues[train]
+        At = self.__design(self._xValues[test])
+        yt = self._yValues[test]
+        err = np.empty(self._maxOrder + 1)
+        for p in range(self._maxOrder + 1):
+            c = np.linalg.solve(R[:p + 1, :p + 1], qy[:p + 1])
+            e = yt - At[:, :p + 1] @ c
+            err[p] = e @ e
+        return err
+
     def __compute(self):
-        self._sumX = 0 
-        self._sumY = 0
-        self._sumXY = 0
-        self._sumXSq = 0
-        self._sumYSq = 0
-        for itemX, itemY in zip(self._xValues, self._yValues):
-            self._sumX += itemX
-            self._sumY += itemY
-            self._sumXY += itemX * itemY
-            self._sumXSq += itemX ** 2
-            self._sumYSq += itemY ** 2
+        n, m = self._n, self._maxOrder + 1
+        Q, R = np.linalg.qr(self.__design(self._xValues))
+        qy = Q.T @ self._yValues
+        fit = np.zeros(n)
+        h = np.zeros(n)
+        rss = np.empty(m)
+        loo = np.empty(m)
+        for p in range(m):
+            fit += Q[:, p] * qy[p]
+            h += Q[:, p]**2
+            # residuals are formed directly, ||y||^2 - ||Q^T y||^2 cancels.
+            r = self._yValues - fit
+            rss[p] = r @ r
+            e = r / np.maximum(1 - h, np.finfo(np.float64).eps)
+            loo[p] = e @ e / n
+        k = np.arange(1, m + 1)
+        with np.errstate(divide='ignore'):
+            logRss = np.log(rss / n)
+        self._scores = {'rss' : rss,
+                        'aic' : n * logRss + 2 * k,
+                        'bic' : n * logRss + k * np.log(n),
+                        'loo' : loo}
+        if self._folds > 1:
+            fold = np.random.default_rng(self._seed).permutation(n) % self._folds
+            splits = [(fold != f, fold == f) for f in range(self._folds)]
+            if self._workers == 1:
+                errs = [self.__foldErrors(tr, te) for tr, te in splits]
+            else:
+                with ThreadPoolExecutor(self._workers) as executor:
+                    errs = list(executor.map(lambda s: self.__foldErrors(*s), splits))
+            self._scores['cv'] = np.sum(errs, axis=0) / n
+        elif self._criterion == 'cv':
+            raise Exception("Cross validation need at least 2 folds.")
+        self._order = int(np.argmin(self._scores[self._criterion]))
 
     def results(self):
         """
-        This function return coefficient of Exponential Regression.
+        This function return selected order.
 
         Return :
         --------
-                Return will be two coefficients which are A and B.
+                Return will be order which minimize criterion.
+        """
+        return self._order
+
+    def scores(self):
+        """
+        This function return criteria of each order from 0 to maxOrder.
+
+        Return :
+        --------
+                Return will be dictionary of arrays with keys 'rss', 'aic', 
+                'bic', 'loo' and 'cv' (mean squared validation error).
+        """
+        return self._scores
+
+    def model(self):
+        """
+        This function return regression of selected order.
+
+        Return :
+        --------
+                Return will be PolynomialRegression or 
+                OrthogonalPolynomialRegression w.r.t basis.
+        """
+        if self._basis == 'chebyshev':
+            return OrthogonalPolynomialRegression(self._xValues, self._yValues, self._order)
+        return PolynomialRegression(self._xValues, self._yValues, self._order)
+
+
+
+class SparseRegression():
+    """
+    This class written for Linear Least-Squares Regression with large 
+    sparse design matrix (ex: one-hot or spline basis) which cannot be 
+    solved with dense matrices. Problem solved iteratively with LSQR or 
+    conjugate gradient on normal equations (CGLS), only products with 
+    design matrix and its transpose are used.
+
+    minimize ||A c - y||^2 + damp^2 ||c||^2
+
+    Arguments :
+        -------------
+        A = design matrix. Can be scipy.sparse matrix (or any object which 
+        support `A @ v` and `A.T @ v`) or COO triplet (rows, cols, values).
+
+        yValues = y values of data.
+
+        method = iterative solver. 'lsqr' or 'cg'. Default is 'lsqr'.
+
+        damp = ridge damping. Default is 0.
+
+        x0 = initial guess of coefficients (warm start). Default is zero.
+
+        tol = relative tolerance of solver. Default is 1e-10.
+
+        maxIt = maximum iteration number. Default is 2 * number of 
+        coefficients.
+
+        shape = shape of design matrix for COO triplet. Default is found 
+        from indices.
+
+    \n Class has 3 methods. \n
+        - results() : Return of coefficients.
+        - iterations() : Return of number of iterations.
+        - residualNorm() : Return of norms of residual and normal residual.
+
+        @Usage :
+        ...
+        cf = SparseRegression((rows, cols, values), y, damp=0.1)
+        coeff = cf.results()
+        it = cf.iterations()
+        r, rNormal = cf.residualNorm()
+        cf2 = SparseRegression(A, yNew, x0=coeff)
+        ...
+
+    """
+    def __init__(self, A, yValues, method='lsqr', damp=0., x0=None, tol=1e-10, 
+                 maxIt=None, shape=None):
+        self._y = np.asarray(yValues, dtype=np.float64)
+        self._method = method.lower()
+        self._damp = float(damp)
+        self._tol = tol
+        if isinstance(A, tuple):
+            rows, cols, vals = (np.asarray(v) for v in A)
+            vals = vals.astype(np.float64)
+            if shape is None:
+                shape = (int(rows.max()) + 1, int(cols.max()) + 1)
+            self._matvec = lambda v: np.bincount(rows, weights=vals * v[cols], minlength=shape[0])
+            self._rmatvec = lambda u: np.bincount(cols, weights=vals * u[rows], minlength=shape[1])
+        else:
+            shape = A.shape
+            self._matvec = lambda v: np.asarray(A @ v).ravel()
+            self._rmatvec = lambda u: np.asarray(A.T @ u).ravel()
+        self._shape = shape
+        if len(self._y) != shape[0]:
+            raise Exception("Number of rows of design matrix and y values should be same.")
+        self._x0 = np.zeros(shape[1]) if x0 is None else np.array(x0, dtype=np.float64)
+        self._maxIt = 2 * shape[1] if maxIt is None else maxIt
+        if self._method == 'lsqr':
+            self.__lsqr()
+        elif self._method == 'cg':
+            self.__cgls()
+        else:
+            raise Exception("method should be 'lsqr' or 'cg'.")
+        r = self._y - self._matvec(self._a)
+        self._rNorm = np.linalg.norm(r)
+        self._rNormal = np.linalg.norm(self._rmatvec(r) - self._damp**2 * self._a)
+
+    def __lsqr(self):
+        # LSQR of [A; damp I] dx = [y - A x0; -damp x0] so warm start and 
+        # damping solved together.
+        d = self._damp
+        m = self._shape[0]
+        matvec = lambda v: np.concatenate((self._matvec(v), d * v)) if d else self._matvec(v)
+        rmatvec = lambda u: self._rmatvec(u[:m]) + d * u[m:] if d else self._rmatvec(u)
+        u = self._y - self._matvec(self._x0)
+        if d:
+            u = np.concatenate((u, -d * self._x0))
+        x = np.zeros(self._shape[1])
+        beta = np.linalg.norm(u)
+        bNorm = beta
+        if beta > 0:
+            u /= beta
+        v = rmatvec(u)
+        alpha = np.linalg.norm(v)
+        if alpha > 0:
+            v /= alpha
+        w = v.copy()
+        phibar, rhobar = beta, alpha
+        aNorm = 0.
+        self._it = 0
+        if alpha * beta == 0:
+            self._a = self._x0
+            return
+        for self._it in range(1, self._maxIt + 1):
+            u = matvec(v) - alpha * u
+            beta = np.linalg.norm(u)
+            if beta > 0:
+                u /= beta
+            aNorm = np.sqrt(aNorm**2 + alpha**2 + beta**2)
+            v = rmatvec(u) - beta * v
+            alpha = np.linalg.norm(v)
+            if alpha > 0:
+                v /= alpha
+            rho = np.hypot(rhobar, beta)
+            c, sn = rhobar / rho, beta / rho
+            theta = sn * alpha
+            rhobar = -c * alpha
+            phi = c * phibar
+            phibar = sn * phibar
+            x += (phi / rho) * w
+            w = v - (theta / rho) * w
+            normalRes = phibar * alpha * abs(c)
+            if phibar <= self._tol * bNorm or normalRes <= self._tol * aNorm * phibar:
+                break
+        self._a = self._x0 + x
+
+    def __cgls(self):
+        d2 = self._damp**2
+        x = self._x0.copy()
+        r = self._y - self._matvec(x)
+        s = self._rmatvec(r) - d2 * x
+        p = s.copy()
+        gamma = s @ s
+        # tolerance relative to normal residual of zero solution, ||A^T y||,
+        # so it does not depend on warm start.
+        sRef = np.linalg.norm(self._rmatvec(self._y))
+        self._it = 0
+        if sRef == 0:
+            self._a = np.zeros(self._shape[1])
+            return
+        if np.sqrt(gamma) <= self._tol * sRef:
+            self._a = x
+            return
+        for self._it in range(1, self._maxIt + 1):
+            q = self._matvec(p)
+            delta = q @ q + d2 * (p @ p)
+            alpha = gamma / delta
+            x += alpha * p
+            r -= alpha * q
+            s = self._rmatvec(r) - d2 * x
+            gammaNew = s @ s
+            if np.sqrt(gammaNew) <= self._tol * sRef:
+                break
+            p = s + (gammaNew / gamma) * p
+            gamma = gammaNew
+        self._a = x
+
+    def results(self):
+        """
+        This function return coefficients of regression.
+
+        Return :
+        --------
+                Return will be array of coefficients.
+        """
+        return self._a
+
+    def iterations(self):
+        """
+        This function return number of iterations of solver.
+
+        Return :
+        --------
+                Return will be number of iterations.
+        """
+        return self._it
+
+    def residualNorm(self):
+        """
+        This function return norm of residual ||y - A c|| and norm of 
+        residual of normal equations ||A^T (y - A c) - damp^2 c||.
+
+        Return :
+        --------
+                Return will be two norms.
+        """
+        return self._rNorm, self._rNormal
+
+
+
+class Interpolation():
+    """
+    This class written for numerical methods interpolation.
+
+        @Methods :
+        - Linear Interpolation
+        - Newton Polynomial Interpolation
+        - Linear Splines
+
+        @Usage :
+        ...
+        interpolate = Interpolation()
+        interpolate.@Methods(arguments..)
+        ...
+    """
+
+
+    def LinearInterpolation(self, pt1, pt2, value, func):
+        """
+            This function calculate value of Linear Interpolation w.r.t func.
+
+            Arguments :
+            -------------
+                pt1 = first point of interpolation.
+
+                pt2 = second point of interpolation.
+
+                value = target value of function. f(value)= ?
+
+                func = target function.
+
+            Return :
+            --------
+                Value of interpolated function.        
+
+                @Usage :
+                ...
+                cf = Interpolation()
+                y = cf.LinearInterpolation(pt1,pt2,value,func)   
+                ...
+        """
+        res = func(pt1) + (func(pt2) - func(pt1)) 
+        res /= (pt2 - pt1) * (value - pt1)
+        return res
+
+    def NewtonPolynomialInterpolation(self, x, y, value, order):
+        """
+            This function calculate value of Newton Polynomial Interpolation.
+
+            @Note : For many evaluations or for adding data points, use 
+            NewtonInterpolation class which keeps divided differences.
+
+            Arguments :
+            -------------
+                x = x values of data.
+
+                y = y values of data.
+
+                valeu = targer value of function. f(value)=?
+
+                order = order of interpolation.
+
+            Return :
+            --------
+                Value of interpolated function and estimated error.        
+
+                @Usage :
+                ...
+                cf = Interpolation()
+                y, err = cf.NewtonPolynomialInterpolation(x, y, value, order)
+                ...
+        """
+        return NewtonInterpolation(x[:order], y[:order]).evaluate(value)
+
+    def LinearSplines(self, x, y, value):
+        """
+            This function calculate value of Linear Spline Interpolation approach.
+
+            @Note : For many evaluations with same data, use LinearSpline 
+            class which prepares data once.
+
+            Arguments :
+            -------------
+                x = x values of data.
+
+                y = y values of data.
+
+                valeu = targer value of function. f(value)=?
+
+
+            Return :
+            --------
+                Value of interpolated function.     
+
+                @Usage :
+                ...
+                cf = Interpolation()
+                y = cf.LinearSplines(x, y, value)
+                ...
+        """
+        return LinearSpline(x, y).evaluate(value)
+
+
+
+class NewtonInterpolation():
+    """
+    This class written for Newton Polynomial Interpolation which keeps 
+    divided differences. New data point added in O(n) without recomputing 
+    table, since only last diagonal of divided-difference table is needed. 
+    Values evaluated vectorized with nested (Horner-like) multiplication.
+
+    Arguments :
+        -------------
+        x = x values of data. Optional.
+
+        y = y values of data. Optional.
+
+    \n Class has 3 methods. \n
+        - addNode(x, y) : Add data point.
+        - evaluate(value) : Return of interpolated values and error estimates.
+        - coefficients() : Return of Newton coefficients.
+
+        @Usage :
+        ...
+        newton = NewtonInterpolation(x, y)
+        newton.addNode(xNew, yNew)
+        y, err = newton.evaluate(values)
+        ...
+
+    """
+    def __init__(self, x=None, y=None):
+        self._x = []
+        self._coef = []
+        self._diag = []
+        if x is not None:
+            if len(x) != len(y):
+                raise Exception("Length of x and y should be same.")
+            for xi, yi in zip(x, y):
+                self.addNode(xi, yi)
+
+    def addNode(self, x, y):
+        """
+            This function add data point to interpolation.
+
+            Arguments :
+            -------------
+                x = x value of data point.
+
+                y = y value of data point.
+        """
+        x, d = float(x), float(y)
+        n = len(self._x)
+        diag = [d]
+        for j in range(1, n + 1):
+            den = x - self._x[n - j]
+            if den == 0:
+                raise Exception("x values should be distinct.")
+            d = (d - self._diag[j - 1]) / den
+            diag.append(d)
+        self._x.append(x)
+        self._diag = diag
+        self._coef.append(d)
+
+    def coefficients(self):
+        """
+            This function return Newton coefficients which are 
+            f[x0], f[x0,x1], f[x0,x1,x2], ...
+
+            Return :
+            --------
+                Array of coefficients.
+        """
+        return np.array(self._coef)
+
+    def evaluate(self, value):
+        """
+            This function calculate value of Newton Polynomial Interpolation.
+
+            Arguments :
+            -------------
+                value = targer value(s) of function. f(value)=?
+                Can be scalar or array.
+
+            Return :
+            --------
+                Value(s) of interpolated function and estimated error(s). 
+                Error is estimated as last term of Newton polynomial.
+
+                @Usage :
+                ...
+                newton = NewtonInterpolation(x, y)
+                y, err = newton.evaluate([0.5, 1.5])
+                ...
+        """
+        n = len(self._x)
+        if n == 0:
+            raise Exception("Interpolation need at least 1 data point.")
+        v = np.asarray(value, dtype=np.float64)
+        res = np.full(v.shape, self._coef[-1])
+        for k in range(n - 2, -1, -1):
+            res *= v - self._x[k]
+            res += self._coef[k]
+        xterm = np.ones(v.shape)
+        for k in range(n - 1):
+            xterm *= v - self._x[k]
+        err = self._coef[-1] * xterm
+        return (res[()], err[()]) if v.ndim == 0 else (res, err)
+
+
+
+def chebyshevPoints(n, a=-1., b=1., kind=2):
+    """
+        This function return Chebyshev points on [a, b].
+
+        Arguments :
+        -------------
+            n = degree, n + 1 points returned.
+
+            a, b = interval of points. Default is [-1, 1].
+
+            kind = 1 for Chebyshev points of first kind (roots), 2 for 
+            second kind (extrema). Default is 2.
+
+        Return :
+        --------
+            Array of points, ordered from b to a.
+
+            @Usage :
+            ...
+            x = chebyshevPoints(100, 0, 5)
+            interp = BarycentricInterpolation(x, f(x), 'chebyshev2')
+            ...
+    """
+    j = np.arange(n + 1)
+    if kind == 1:
+        t = np.cos((2 * j + 1) * np.pi / (2 * n + 2))
+    elif kind == 2:
+        t = np.cos(j * np.pi / n) if n > 0 else np.zeros(1)
+    else:
+        raise Exception("kind should be 1 or 2.")
+    return (a + b) / 2 + (b - a) / 2 * t
+
+
+
+class BarycentricInterpolation():
+    """
+    This class written for Barycentric Lagrange Interpolation. Weights 
+    computed once, in O(n) closed form for Chebyshev points, then each 
+    point evaluated in O(n) with barycentric formula which is stable also 
+    for high degree (100+) on Chebyshev points.
+
+    Arguments :
+        -------------
+        x = x values of data. Should be distinct.
+
+        y = y values of data.
+
+        nodes = Type of x values.
+
+            arbitrary = any distinct points, weights computed in O(n^2).
+            (Default)
+
+            chebyshev1 = Chebyshev points of first kind, ordered.
+
+            chebyshev2 = Chebyshev points of second kind, ordered.
+
+        chunkSize = number of points evaluated at once. Default is 2^14.
+
+    \n Class has 1 methods. \n
+        - evaluate(value) : Return of interpolated values.
+
+        @Usage :
+        ...
+        x = chebyshevPoints(200, 0, 5)
+        interp = BarycentricInterpolation(x, f(x), 'chebyshev2')
+        y = interp.evaluate(values)
+        ...
+
+    """
+    def __init__(self, x, y, nodes='arbitrary', chunkSize=2**14):
+        self._x = np.array(x, dtype=np.float64)
+        self._y = np.array(y, dtype=np.float64)
+        self._chunkSize = int(chunkSize)
+        if self._x.ndim != 1 or self._x.shape != self._y.shape:
+            raise Exception("x and y should be 1-D arrays with same length.")
+        n = len(self._x) - 1
+        j = np.arange(n + 1)
+        nodes = nodes.lower()
+        if nodes == 'chebyshev2':
+            self._w = (-1.) ** j
+            self._w[0] /= 2 ; self._w[-1] /= 2
+        elif nodes == 'chebyshev1':
+            self._w = (-1.) ** j * np.sin((2 * j + 1) * np.pi / (2 * n + 2))
+        elif nodes == 'arbitrary':
+            # products scaled with capacity of interval and summed in log 
+            # to avoid overflow at high degree.
+            D = self._x[:, np.newaxis] - self._x
+            if n > 0:
+                D *= 4 / (self._x.max() - self._x.min())
+            np.fill_diagonal(D, 1.)
+            if np.any(D == 0):
+                raise Exception("x values should be distinct.")
+            sign = np.prod(np.sign(D), axis=1)
+            logw = -np.sum(np.log(np.abs(D)), axis=1)
+            self._w = sign * np.exp(logw - logw.max())
+        else:
+            raise Exception("nodes should be 'arbitrary', 'chebyshev1' or 'chebyshev2'.")
+
+    def evaluate(self, value):
+        """
+            This function calculate value of Barycentric Interpolation.
+
+            Arguments :
+            -------------
+                value = targer value(s) of function. f(value)=?
+                Can be scalar or array.
+
+            Return :
+            --------
+                Value(s) of interpolated function.     
+
+                @Usage :
+                ...
+                interp = BarycentricInterpolation(x, y)
+                y = interp.evaluate([0.5, 1.5])
+                ...
+        """
+        v = np.asarray(value, dtype=np.float64)
+        flat = v.ravel()
+        res = np.empty(flat.shape)
+        step = self._chunkSize
+        for i in range(0, len(flat), step):
+            vc = flat[i:i + step]
+            diff = vc[:, np.newaxis] - self._x
+            exact = diff == 0
+            diff[exact] = 1.
+            c = self._w / diff
+            part = (c @ self._y) / c.sum(axis=1)
+            hit = exact.any(axis=1)
+            if np.any(hit):
+                part[hit] = self._y[np.argmax(exact[hit], axis=1)]
+            res[i:i + step] = part
+        res = res.reshape(v.shape)
+        return res[()] if res.ndim == 0 else res
+
+
+
+class LinearSpline():
+    """
+    This class written for Linear Spline Interpolation of fixed data 
+    which evaluated many times. Data validated and slopes computed once, 
+    then any array of points evaluated vectorized. Interval of each point 
+    found with binary search (np.searchsorted) or, if x values are equally 
+    spaced, with O(1) index arithmetic.
+
+    Arguments :
+        -------------
+        x = x values of data. Should be strictly increasing.
+
+        y = y values of data.
+
+        extrapolate = Behaviour for points out of data range.
+
+            linear = extend first and last segments. (Default)
+
+            constant = use first and last y values.
+
+            nan = return NaN.
+
+            raise = raise Exception.
+
+    \n Class has 1 methods. \n
+        - evaluate(value) : Return of interpolated values.
+
+        @Usage :
+        ...
+        spline = LinearSpline(x, y)
+        y = spline.evaluate(values)
+        ...
+
+    """
+    def __init__(self, x, y, extrapolate='linear'):
+        self._x = np.array(x, dtype=np.float64)
+        self._y = np.array(y, dtype=np.float64)
+        self._extrapolate = extrapolate.lower()
+        if self._x.ndim != 1 or self._x.shape != self._y.shape:
+            raise Exception("x and y should be 1-D arrays with same length.")
+        if len(self._x) < 2:
+            raise Exception("At least 2 data points needed.")
+        if self._extrapolate not in ('linear', 'constant', 'nan', 'raise'):
+            raise Exception("extrapolate should be 'linear', 'constant', 'nan' or 'raise'.")
+        h = np.diff(self._x)
+        if np.any(h <= 0):
+            raise Exception("x values should be strictly increasing.")
+        self._m = np.diff(self._y) / h
+        self._uniform = np.allclose(h, h[0], rtol=1e-12, atol=0)
+        self._h = h[0]
+
+    def _index(self, v):
+        n = len(self._x)
+        if self._uniform:
+            idx = np.floor((v - self._x[0]) / self._h)
+            idx = np.clip(np.nan_to_num(idx), 0, n - 2).astype(np.intp)
+        else:
+            idx = np.clip(np.searchsorted(self._x, v, 'right') - 1, 0, n - 2)
+        return idx
+
+    def _outside(self, v, res, low=None, high=None):
+        out = (v < self._x[0]) | (v > self._x[-1])
+        if not np.any(out):
+            return res
+        if self._extrapolate == 'raise':
+            raise Exception("Value is out of range of data.")
+        elif self._extrapolate == 'nan':
+            res[out] = np.nan
+        elif self._extrapolate == 'constant':
+            res[v < self._x[0]] = self._y[0] if low is None else low[v < self._x[0]]
+            res[v > self._x[-1]] = self._y[-1] if high is None else high[v > self._x[-1]]
+        return res
+
+    def evaluate(self, value):
+        """
+            This function calculate value of Linear Spline Interpolation.
+
+            Arguments :
+            -------------
+                value = targer value(s) of function. f(value)=?
+                Can be scalar or array.
+
+            Return :
+            --------
+                Value(s) of interpolated function.     
+
+                @Usage :
+                ...
+                spline = LinearSpline(x, y)
+                y = spline.evaluate([0.5, 1.5, 2.5])
+                ...
+        """
+        v = np.asarray(value, dtype=np.float64)
+        idx = self._index(v)
+        res = self._y[idx] + self._m[idx] * (v - self._x[idx])
+        res = self._outside(v, np.atleast_1d(res)).reshape(v.shape)
+        return res[()] if res.ndim == 0 else res
+
+
+class RegularGridInterpolation():
+    """
+    This class written for N dimensional interpolation of tables on 
+    regular (rectilinear) grids, ex: bilinear or trilinear interpolation.
+    Spacing of axes precomputed, cells located with O(1) index arithmetic 
+    for equally spaced axes or binary search (np.searchsorted) for others, 
+    and batches of points evaluated vectorized. Table kept as contiguous 
+    float64 array or memory-mapped file, so large tables can be shared 
+    between processes.
+
+    Arguments :
+        -------------
+        grid = list of x values of each axis. Each should be strictly 
+        increasing.
+
+        values = table of values with shape (len(grid[0]), len(grid[1]), ...).
+        Can be array, memory-mapped array or path of `.npy` file which 
+        opened memory-mapped.
+
+        method = Type of interpolation.
+
+            linear = N-linear interpolation. (Default)
+
+            cubic = tensor product of cubic Hermite (Catmull-Rom) 
+            interpolation with finite difference slopes.
+
+        extrapolate = Behaviour for points out of grid.
+
+            linear = extend edge cells. (Default)
+
+            constant = use nearest edge of grid.
+
+            nan = return NaN.
+
+            raise = raise Exception.
+
+    \n Class has 1 methods. \n
+        - evaluate(points) : Return of interpolated values.
+
+        @Usage :
+        ...
+        table = RegularGridInterpolation([x, y], values)
+        v = table.evaluate([[0.5, 1.2], [0.7, 2.1]])
+        v = table.evaluate(np.stack((X, Y), axis=-1))
+
+        table = RegularGridInterpolation([x, y, z], 'map.npy', 'cubic')
+        ...
+
+    """
+    def __init__(self, grid, values, method='linear', extrapolate='linear'):
+        self._grid = [np.array(g, dtype=np.float64) for g in grid]
+        if isinstance(values, str):
+            values = np.load(values, mmap_mode='r')
+        if not (isinstance(values, np.memmap) and values.dtype == np.float64 
+                and values.flags['C_CONTIGUOUS']):
+            values = np.ascontiguousarray(values, dtype=np.float64)
+        self._values = values
+        self._method = method.lower()
+        self._extrapolate = extrapolate.lower()
+        self._dim = len(self._grid)
+        if self._method not in ('linear', 'cubic'):
+            raise Exception("method should be 'linear' or 'cubic'.")
+        if self._extrapolate not in ('linear', 'constant', 'nan', 'raise'):
+            raise Exception("extrapolate should be 'linear', 'constant', 'nan' or 'raise'.")
+        if values.shape != tuple(len(g) for g in self._grid):
+            raise Exception("Shape of values should be same with lengths of grid axes.")
+        self._uniform, self._h = [], []
+        for g in self._grid:
+            if g.ndim != 1 or len(g) < 2:
+                raise Exception("Each grid axis should have at least 2 points.")
+            h = np.diff(g)
+            if np.any(h <= 0):
+                raise Exception("Grid axes should be strictly increasing.")
+            self._uniform.append(np.allclose(h, h[0], rtol=1e-12, atol=0))
+            self._h.append(h[0])
+        self._strides = np.array([int(np.prod(values.shape[k + 1:])) for k in range(self._dim)])
+        self._flat = values.reshape(-1)
+
+    def __locate(self, k, q):
+        g = self._grid[k]
+        n = len(g)
+        if self._uniform[k]:
+            idx = np.floor((q - g[0]) / self._h[k])
+            return np.clip(np.nan_to_num(idx), 0, n - 2).astype(np.intp)
+        return np.clip(np.searchsorted(g, q, 'right') - 1, 0, n - 2)
+
+    def __axisWeights(self, k, q):
+        # index and weight of each node of axis k which contributes.
+        g = self._grid[k]
+        n = len(g)
+        i = self.__locate(k, q)
+        x0, x1 = g[i], g[i + 1]
+        h = x1 - x0
+        t = (q - x0) / h
+        if self._method == 'linear':
+            return [i, i + 1], [1 - t, t]
+        im, ip = np.maximum(i - 1, 0), np.minimum(i + 2, n - 1)
+        t2, t3 = t * t, t * t * t
+        h00, h10 = 2 * t3 - 3 * t2 + 1, t3 - 2 * t2 + t
+        h01, h11 = -2 * t3 + 3 * t2, t3 - t2
+        a = h10 * h / (x1 - g[im])
+        b = h11 * h / (g[ip] - x0)
+        return [im, i, i + 1, ip], [-a, h00 - b, h01 + a, b]
+
+    def evaluate(self, points):
+        """
+            This function calculate interpolated values at points.
+
+            Arguments :
+            -------------
+                points = points which table evaluated. Array with shape 
+                (..., number of dimensions).
+
+            Return :
+            --------
+                Array of interpolated values with shape (...).     
+
+                @Usage :
+                ...
+                table = RegularGridInterpolation([x, y], values)
+                v = table.evaluate([[0.5, 1.2], [0.7, 2.1]])
+                ...
+        """
+        pts = np.asarray(points, dtype=np.float64)
+        if pts.shape[-1] != self._dim:
+            raise Exception("Last axis of points should be number of dimensions.")
+        shape = pts.shape[:-1]
+        pts = pts.reshape(-1, self._dim)
+        out = np.zeros(len(pts), dtype=bool)
+        axes = []
+        for k in range(self._dim):
+            g, q = self._grid[k], pts[:, k]
+            outk = (q < g[0]) | (q > g[-1])
+            if np.any(outk):
+                if self._extrapolate == 'raise':
+                    raise Exception("Point is out of range of grid.")
+                if self._extrapolate == 'constant':
+                    q = np.clip(q, g[0], g[-1])
+                out |= outk
+            axes.append(self.__axisWeights(k, q))
+        res = np.zeros(len(pts))
+        for corner in np.ndindex(*(len(a[0]) for a in axes)):
+            flat = np.zeros(len(pts), dtype=np.intp)
+            w = np.ones(len(pts))
+            for k, c in enumerate(corner):
+                flat += axes[k][0][c] * self._strides[k]
+                w *= axes[k][1][c]
+            res += w * self._flat[flat]
+        if self._extrapolate == 'nan':
+            res[out] = np.nan
+        res = res.reshape(shape)
+        return res[()] if res.ndim == 0 else res
+
+
+
+class RBFInterpolation():
+    """
+    This class written for interpolation of scattered data in any 
+    dimension with local Radial Basis Functions (RBF). 
+
+    Instead of one dense n x n system, KD-tree (scipy.spatial.cKDTree) 
+    used to find nearest data point of each query and RBF system of k 
+    nearest neighbors of that data point solved. Solutions of systems 
+    (coefficients) cached per neighborhood, and all systems of a batch 
+    solved together. Build time is O(n log n) and query time is sublinear 
+    in number of data. Query batches can be evaluated in parallel threads.
+
+    @Note : Need scipy. Interpolant is exact at data points and smooth 
+    inside each neighborhood, it may have small jumps where nearest data 
+    point changes.
+
+    Arguments :
+        -------------
+        points = coordinates of data, shape (n, number of dimensions).
+
+        values = values of data, shape (n).
+
+        neighbors = number of neighbors of each local system. Default is 20.
+
+        kernel = Radial basis function. 'thin_plate', 'cubic', 'linear', 
+        'multiquadric', 'inverse_multiquadric' or 'gaussian'. Default is 
+        'thin_plate'. Linear polynomial added to all kernels.
+
+        epsilon = shape parameter of 'multiquadric', 'inverse_multiquadric' 
+        and 'gaussian' kernels, relative to size of neighborhood. 
+        Default is 1.
+
+        workers = number of threads which evaluate query chunks. Default is 1.
+
+        chunkSize = number of query points evaluated at once. Default is 2^14.
+
+    \n Class has 1 methods. \n
+        - evaluate(points) : Return of interpolated values.
+
+        @Usage :
+        ...
+        rbf = RBFInterpolation(xy, z, neighbors=30, workers=4)
+        v = rbf.evaluate(queries)
+        ...
+
+    """
+    def __init__(self, points, values, neighbors=20, kernel='thin_plate', epsilon=1., 
+                 workers=1, chunkSize=2**14):
+        try:
+            from scipy.spatial import cKDTree
+        except ImportError:
+            raise Exception("RBFInterpolation need scipy.")
+        self._points = np.ascontiguousarray(points, dtype=np.float64)
+        if self._points.ndim == 1:
+            self._points = self._points.reshape(-1, 1)
+        self._values = np.asarray(values, dtype=np.float64)
+        n, d = self._points.shape
+        if len(self._values) != n:
+            raise Exception("Number of points and values should be same.")
+        self._kernel = kernel.lower()
+        if self._kernel not in ('thin_plate', 'cubic', 'linear', 'multiquadric', 
+                                'inverse_multiquadric', 'gaussian'):
+            raise Exception("Unknown kernel : " + kernel)
+        self._k = min(int(neighbors), n)
+        if self._k < d + 2:
+            raise Exception("Number of neighbors should be at least number of dimensions + 2.")
+        self._epsilon = epsilon
+        self._workers = max(int(workers), 1)
+        self._chunkSize = int(chunkSize)
+        self._tree = cKDTree(self._points)
+        self._ready = np.zeros(n, dtype=bool)
+        self._nbr = np.empty((n, self._k), dtype=np.intp)
+        self._scale = np.empty(n)
+        self._coef = np.empty((n, self._k + d + 1))
+
+    def __phi(self, r):
+        er2 = (self._epsilon * r)**2
+        if self._kernel == 'thin_plate':
+            return np.where(r > 0, r * r * np.log(np.where(r > 0, r, 1.)), 0.)
+        elif self._kernel == 'cubic':
+            return r**3
+        elif self._kernel == 'linear':
+            return r
+        elif self._kernel == 'multiquadric':
+            return np.sqrt(1 + er2)
+        elif self._kernel == 'inverse_multiquadric':
+            return 1 / np.sqrt(1 + er2)
+        return np.exp(-er2)
+
+    def __prepare(self, centers):
+        # solve local systems of neighborhoods which are not cached yet.
+        centers = centers[~self._ready[centers]]
+        if len(centers) == 0:
+            return
+        k, d = self._k, self._points.shape[1]
+        dist, nbr = self._tree.query(self._points[centers], k)
+        nbr = nbr.reshape(len(centers), k)
+        scale = np.max(dist.reshape(len(centers), k), axis=1)
+        scale[scale == 0] = 1.
+        X = (self._points[nbr] - self._points[centers][:, np.newaxis]) / scale[:, np.newaxis, np.newaxis]
+        r = np.linalg.norm(X[:, :, np.newaxis] - X[:, np.newaxis], axis=-1)
+        M = np.zeros((len(centers), k + d + 1, k + d + 1))
+        M[:, :k, :k] = self.__phi(r)
+        M[:, :k, k] = 1.
+        M[:, :k, k + 1:] = X
+        M[:, k, :k] = 1.
+        M[:, k + 1:, :k] = X.transpose(0, 2, 1)
+        rhs = np.zeros((len(centers), k + d + 1))
+        rhs[:, :k] = self._values[nbr]
+        try:
+            coef = np.linalg.solve(M, rhs[..., np.newaxis])[..., 0]
+        except np.linalg.LinAlgError:
+            coef = np.array([np.linalg.lstsq(Mi, ri, rcond=None)[0] for Mi, ri in zip(M, rhs)])
+        self._nbr[centers] = nbr
+        self._scale[centers] = scale
+        self._coef[centers] = coef
+        self._ready[centers] = True
+
+    def __evaluateChunk(self, q, center=None):
+        k = self._k
+        if center is None:
+            _, center = self._tree.query(q, 1)
+            self.__prepare(np.unique(center))
+        nbr, scale, coef = self._nbr[center], self._scale[center], self._coef[center]
+        X = (self._points[nbr] - self._points[center][:, np.newaxis]) / scale[:, np.newaxis, np.newaxis]
+        Q = (q - self._points[center]) / scale[:, np.newaxis]
+        phi = self.__phi(np.linalg.norm(X - Q[:, np.newaxis], axis=-1))
+        return (np.einsum('ij,ij->i', phi, coef[:, :k]) + coef[:, k] 
+                + np.einsum('ij,ij->i', Q, coef[:, k + 1:]))
+
+    def evaluate(self, points):
+        """
+            This function calculate interpolated values at points.
+
+            Arguments :
+            -------------
+                points = points which data interpolated. Array with shape 
+                (..., number of dimensions).
+
+            Return :
+            --------
+                Array of interpolated values with shape (...).     
+
+                @Usage :
+                ...
+                rbf = RBFInterpolation(xy, z)
+                v = rbf.evaluate([[0.5, 1.2], [0.7, 2.1]])
+                ...
+        """
+        d = self._points.shape[1]
+        q = np.asarray(points, dtype=np.float64)
+        if d == 1 and (q.ndim == 0 or q.shape[-1] != 1):
+            q = q[..., np.newaxis]
+        shape = q.shape[:-1]
+        q = q.reshape(-1, d)
+        chunks = [q[i:i + self._chunkSize] for i in range(0, len(q), self._chunkSize)]
+        if self._workers == 1 or len(chunks) < 2:
+            res = [self.__evaluateChunk(c) for c in chunks]
+        else:
+            # neighborhoods of all chunks prepared first in disjoint parts, 
+            # so threads only read the cache while evaluating.
+            _, center = self._tree.query(q, 1, workers=self._workers)
+            unique = np.unique(center)
+            unique = unique[~self._ready[unique]]
+            parts = [unique[i:i + self._chunkSize] for i in range(0, len(unique), self._chunkSize)]
+            centers = [center[i:i + self._chunkSize] for i in range(0, len(q), self._chunkSize)]
+            with ThreadPoolExecutor(self._workers) as executor:
+                list(executor.map(self.__prepare, parts))
+                res = list(executor.map(self.__evaluateChunk, chunks, centers))
+        res = np.concatenate(res) if res else np.empty(0)
+        res = res.reshape(shape)
+        return res[()] if res.ndim == 0 else res
+
+
+
+class CubicSpline(LinearSpline):
+    """
+    This class written for Cubic Spline Interpolation. Second derivatives 
+    at knots found from tridiagonal system with Thomas algorithm in O(n) 
+    time and memory. Values, derivatives and integrals evaluated 
+    vectorized with binary search (np.searchsorted).
+
+    Arguments :
+        -------------
+        x = x values of data. Should be strictly increasing.
+
+        y = y values of data.
+
+        bc = Boundary condition of spline.
+
+            natural = second derivatives at end points are zero. (Default)
+
+            clamped = first derivatives at end points are given with 
+            dydx0 and dydxN.
+
+            not-a-knot = third derivatives are continuous at second and 
+            second last knots. Need at least 4 data points.
+
+        dydx0, dydxN = first derivatives at first and last knots for 
+        'clamped' boundary condition. Default are 0.
+
+        extrapolate = Behaviour for points out of data range.
+
+            linear = extend linearly with value and slope of spline at 
+            first and last knots. (Default)
+
+            constant = use first and last y values.
+
+            nan = return NaN.
+
+            raise = raise Exception.
+
+    \n Class has 3 methods. \n
+        - evaluate(value, der) : Return of interpolated values or derivatives.
+        - integrate(a, b) : Return of integral of spline from a to b.
+        - updateKnot(i, y) : Change y value of i'th knot.
+
+        @Usage :
+        ...
+        spline = CubicSpline(x, y, 'not-a-knot')
+        y = spline.evaluate(values)
+        dy = spline.evaluate(values, 1)
+        I = spline.integrate(x[0], x[-1])
+        spline.updateKnot(5, 2.3)
+        ...
+
+    """
+    _updateReach = 64
+
+    def __init__(self, x, y, bc='natural', dydx0=0., dydxN=0., extrapolate='linear'):
+        super().__init__(x, y, extrapolate)
+        self._bc = bc.lower()
+        self._dydx0, self._dydxN = dydx0, dydxN
+        n = len(self._x)
+        if self._bc not in ('natural', 'clamped', 'not-a-knot'):
+            raise Exception("bc should be 'natural', 'clamped' or 'not-a-knot'.")
+        if self._bc == 'not-a-knot' and n < 4:
+            raise Exception("not-a-knot boundary condition need at least 4 data points.")
+        self.__bands()
+        self._M = np.zeros(n)
+        s, e = self._range
+        self._M[s:e] = self.__thomas(self._sub[s:e], self._diag[s:e], self._sup[s:e], self.__rhs(s, e))
+        self.__ends()
+        self._C = None
+
+    def __bands(self):
+        # Tridiagonal system of second derivatives M[s:e]. For natural and 
+        # not-a-knot, end values are not unknowns of system.
+        h = np.diff(self._x)
+        n = len(self._x)
+        self._hh = h
+        self._sub, self._diag, self._sup = np.zeros(n), np.ones(n), np.zeros(n)
+        self._sub[1:-1] = h[:-1]
+        self._diag[1:-1] = 2 * (h[:-1] + h[1:])
+        self._sup[1:-1] = h[1:]
+        if self._bc == 'clamped':
+            self._range = (0, n)
+            self._diag[0], self._sup[0] = 2 * h[0], h[0]
+            self._sub[-1], self._diag[-1] = h[-1], 2 * h[-1]
+        else:
+            self._range = (1, n - 1)
+        if self._bc == 'not-a-knot':
+            h0, h1 = h[0], h[1]
+            self._diag[1] = (h0 + h1) * (h0 + 2 * h1) / h1
+            self._sup[1] = (h1**2 - h0**2) / h1
+            h0, h1 = h[-1], h[-2]
+            self._diag[-2] = (h0 + h1) * (h0 + 2 * h1) / h1
+            self._sub[-2] = (h1**2 - h0**2) / h1
+        self._sub[self._range[0]] = 0
+        self._sup[self._range[1] - 1] = 0
+
+    def __rhs(self, lo, hi):
+        # Right hand side of rows lo..hi-1.
+        n = len(self._x)
+        a, b = max(lo - 1, 0), min(hi, n - 1)
+        d = self._m[a:b]
+        rows = np.clip(np.arange(lo, hi), 1, n - 2)
+        r = 6 * (d[rows - a] - d[rows - 1 - a])
+        if lo == 0 and hi > 0:
+            r[0] = 6 * (d[0] - self._dydx0)
+        if hi == n and hi > lo:
+            r[-1] = 6 * (self._dydxN - d[-1])
+        return r
+
+    def __thomas(self, a, b, c, r):
+        n = len(b)
+        cp, rp = np.empty(n), np.empty(n)
+        if n == 0:
+            return rp
+        cp[0], rp[0] = c[0] / b[0], r[0] / b[0]
+        for i in range(1, n):
+            den = b[i] - a[i] * cp[i - 1]
+            cp[i] = c[i] / den
+            rp[i] = (r[i] - a[i] * rp[i - 1]) / den
+        for i in range(n - 2, -1, -1):
+            rp[i] -= cp[i] * rp[i + 1]
+        return rp
+
+    def __ends(self):
+        if self._bc == 'not-a-knot':
+            h, M = self._hh, self._M
+            M[0] = ((h[0] + h[1]) * M[1] - h[0] * M[2]) / h[1]
+            M[-1] = ((h[-1] + h[-2]) * M[-2] - h[-1] * M[-3]) / h[-2]
+
+    def updateKnot(self, i, y):
+        """
+            This function change y value of i'th knot. Only second 
+            derivatives of near knots are recomputed, since effect of 
+            change decays exponentially along spline and it is below 
+            round-off after few tens of knots.
+
+            Arguments :
+            -------------
+                i = index of knot.
+
+                y = new y value of knot.
+
+            @Usage :
+            ...
+            spline = CubicSpline(x, y)
+            spline.updateKnot(5, 2.3)
+            ...
+        """
+        n = len(self._x)
+        i = i % n
+        s, e = self._range
+        lo = max(s, i - 1 - self._updateReach)
+        hi = min(e, i + 2 + self._updateReach)
+        rOld = self.__rhs(lo, hi)
+        self._y[i] = y
+        for j in (i - 1, i):
+            if 0 <= j < n - 1:
+                self._m[j] = (self._y[j + 1] - self._y[j]) / self._hh[j]
+        dr = self.__rhs(lo, hi) - rOld
+        a, c = self._sub[lo:hi].copy(), self._sup[lo:hi].copy()
+        a[0], c[-1] = 0, 0
+        self._M[lo:hi] += self.__thomas(a, self._diag[lo:hi], c, dr)
+        self.__ends()
+        self._C = None
+
+    def __endSlopes(self):
+        h, y, M = self._hh, self._y, self._M
+        s0 = (y[1] - y[0]) / h[0] - h[0] * (2 * M[0] + M[1]) / 6
+        sN = (y[-1] - y[-2]) / h[-1] + h[-1] * (2 * M[-1] + M[-2]) / 6
+        return s0, sN
+
+    def __linear(self, v, res, der):
+        # linear extension out of data range for extrapolate='linear'.
+        lo, hi = v < self._x[0], v > self._x[-1]
+        if not (np.any(lo) or np.any(hi)):
+            return res
+        s0, sN = self.__endSlopes()
+        if der == 0:
+            res[lo] = self._y[0] + s0 * (v[lo] - self._x[0])
+            res[hi] = self._y[-1] + sN * (v[hi] - self._x[-1])
+        elif der == 1:
+            res[lo], res[hi] = s0, sN
+        else:
+            res[lo | hi] = 0.
+        return res
+
+    def __pieces(self, v):
+        idx = self._index(v)
+        x0, x1 = self._x[idx], self._x[idx + 1]
+        h = self._hh[idx]
+        return idx, v - x0, x1 - v, h, self._M[idx], self._M[idx + 1]
+
+    def evaluate(self, value, der=0):
+        """
+            This function calculate value or derivative of Cubic Spline 
+            Interpolation.
+
+            Arguments :
+            -------------
+                value = targer value(s) of function. f(value)=?
+                Can be scalar or array.
+
+                der = order of derivative, 0 to 3. Default is 0.
+
+            Return :
+            --------
+                Value(s) of interpolated function or its derivative.     
+
+                @Usage :
+                ...
+                spline = CubicSpline(x, y)
+                y = spline.evaluate([0.5, 1.5, 2.5])
+                ...
+        """
+        v = np.asarray(value, dtype=np.float64)
+        idx, tl, tr, h, Ml, Mr = self.__pieces(v)
+        yl, yr = self._y[idx], self._y[idx + 1]
+        cl, cr = yl / h - Ml * h / 6, yr / h - Mr * h / 6
+        if der == 0:
+            res = (Ml * tr**3 + Mr * tl**3) / (6 * h) + cl * tr + cr * tl
+        elif der == 1:
+            res = (Mr * tl**2 - Ml * tr**2) / (2 * h) + cr - cl
+        elif der == 2:
+            res = (Ml * tr + Mr * tl) / h
+        elif der == 3:
+            res = (Mr - Ml) / h
+        else:
+            raise Exception("der should be 0, 1, 2 or 3.")
+        zero = np.zeros(v.shape)
+        res = np.atleast_1d(np.array(res, dtype=np.float64))
+        if self._extrapolate == 'linear':
+            res = self.__linear(np.atleast_1d(v), res, der)
+        elif der == 0:
+            res = self._outside(v, res)
+        else:
+            res = self._outside(v, res, np.atleast_1d(zero), np.atleast_1d(zero))
+        res = res.reshape(v.shape)
+        return res[()] if res.ndim == 0 else res
+
+    def __antiderivative(self, v):
+        if self._C is None:
+            h, y, M = self._hh, self._y, self._M
+            seg = h * (y[:-1] + y[1:]) / 2 - h**3 * (M[:-1] + M[1:]) / 24
+            self._C = np.concatenate(([0.], np.cumsum(seg)))
+        idx, tl, tr, h, Ml, Mr = self.__pieces(v)
+        yl, yr = self._y[idx], self._y[idx + 1]
+        cl, cr = yl / h - Ml * h / 6, yr / h - Mr * h / 6
+        F = (self._C[idx] + (Mr * tl**4 - Ml * (tr**4 - h**4)) / (24 * h) 
+             - cl * (tr**2 - h**2) / 2 + cr * tl**2 / 2)
+        F = np.atleast_1d(np.array(F, dtype=np.float64))
+        vv = np.atleast_1d(v)
+        if self._extrapolate == 'constant':
+            low = self._y[0] * (vv - self._x[0])
+            high = self._C[-1] + self._y[-1] * (vv - self._x[-1])
+            return self._outside(vv, F, low, high)
+        if self._extrapolate == 'linear':
+            lo, hi = vv < self._x[0], vv > self._x[-1]
+            s0, sN = self.__endSlopes()
+            d0, dN = vv[lo] - self._x[0], vv[hi] - self._x[-1]
+            F[lo] = self._y[0] * d0 + s0 * d0**2 / 2
+            F[hi] = self._C[-1] + self._y[-1] * dN + sN * dN**2 / 2
+            return F
+        return self._outside(vv, F)
+
+    def integrate(self, a, b):
+        """
+            This function calculate integral of Cubic Spline from a to b.
+
+            Arguments :
+            -------------
+                a = lower boundary of integral. Can be scalar or array.
+
+                b = upper boundary of integral. Can be scalar or array.
+
+            Return :
+            --------
+                Value(s) of integral.     
+
+                @Usage :
+                ...
+                spline = CubicSpline(x, y)
+                I = spline.integrate(x[0], x[-1])
+                ...
+        """
+        a, b = np.broadcast_arrays(np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64))
+        res = (self.__antiderivative(b) - self.__antiderivative(a)).reshape(a.shape)
+        return res[()] if res.ndim == 0 else res
+
+
+
+class ExponentialRegression():
+    """
+    This class written for numerical methods for Exponential Regression application. 
+
+    Arguments :
+        -------------
+        xValues = x values of curve fitting data.
+
+        yValues = y values of curve fitting data.
+
+        mode = Type of exponential.
+
+            exp = A*exp(Bx)
+
+            nexp = A*B^(x)
+
+    
+    \n Class has 1 methods. \n
+        - results() : Return of coefficient.
+
+        @Usage :
+        ...
+        cf = ExponentialRegression(xValues, yValues, mode)
+        A, B = cf.results()
+        ...
+
+    """
+    def __init__(self, xValues, yValues, mode='exp'):
+        self._xValues = xValues
+        self._yValues = yValues
+        self._mode = mode.lower()
+        self._n = len(xValues)
+        self.__compute()
+
+    def __compute(self):
+        self._acc = ExponentialRegressionAccumulator(self._mode).partial_fit(self._xValues, self._yValues)
+
+    def results(self):
+        """
+        This function return coefficient of Exponential Regression.
+
+        Return :
+        --------
+                Return will be two coefficients which are A and B.
     
                 for mode 'exp' :
                     
@@ -420,15 +2199,666 @@ class ExponentialRegression():
             A, B = cf.results()
             ...
         """
-        a1 = self._n * self._sumXY - self._sumX * self._sumY
-        a1 /= self._n * self._sumXSq - self._sumX **2
-        a0 = arithmaticMean(self._yValues) - a1 * arithmaticMean(self._xValues)        
+        return self._acc.finalize()
 
-        A = np.exp(a0)
 
+
+def _batchData(xValues, yValues, mask=None):
+    # Broadcast x and y to (nSeries, nPoints), weights are 0 for masked 
+    # or NaN points and data of those points replaced with 0.
+    y = np.atleast_2d(np.asarray(yValues, dtype=np.float64))
+    x = np.broadcast_to(np.asarray(xValues, dtype=np.float64), y.shape)
+    w = ~(np.isnan(x) | np.isnan(y))
+    if mask is not None:
+        w &= np.broadcast_to(np.asarray(mask, dtype=bool), y.shape)
+    return np.where(w, x, 0.), np.where(w, y, 0.), w.astype(np.float64)
+
+
+
+class BatchLinearRegression():
+    """
+    This class written for Linear Regression of many independent series 
+    at once. All sums computed with broadcasting over series.
+
+    Arguments :
+        -------------
+        xValues = x values of data. Shape (nPoints) if all series share 
+        x values, otherwise (nSeries, nPoints).
+
+        yValues = y values of data. Shape (nSeries, nPoints).
+
+        mask = optional boolean array, False points are ignored. Points 
+        which x or y is NaN are also ignored, so ragged series can be 
+        padded with NaN.
+
+    \n Class has 3 methods. \n
+        - results() : Return of coefficient arrays.
+        - standartErrorEstimate() : Return of correlation coefficient array.
+        - standardErrors() : Return of standard error of coefficients.
+
+        @Usage :
+        ...
+        cf = BatchLinearRegression(xValues, yValues)
+        a1, a0 = cf.results()
+        r = cf.standartErrorEstimate()
+        sa1, sa0 = cf.standardErrors()
+        ...
+
+    """
+    def __init__(self, xValues, yValues, mask=None):
+        x, y, w = _batchData(xValues, yValues, mask)
+        y = self._transform(y, w)
+        self.__compute(x, y, w)
+
+    def _transform(self, y, w):
+        return y
+
+    def __compute(self, x, y, w):
+        self._n = w.sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self._meanX = (w * x).sum(axis=1) / self._n
+            self._meanY = (w * y).sum(axis=1) / self._n
+            dx = w * (x - self._meanX[:, np.newaxis])
+            dy = w * (y - self._meanY[:, np.newaxis])
+            self._Sxx = np.einsum('ij,ij->i', dx, dx)
+            self._Syy = np.einsum('ij,ij->i', dy, dy)
+            self._Sxy = np.einsum('ij,ij->i', dx, dy)
+            self._a1 = self._Sxy / self._Sxx
+            self._a0 = self._meanY - self._a1 * self._meanX
+
+    def results(self):
+        """
+        This function return coefficients of Linear Regression of each 
+        series.
+
+        Return :
+        --------
+                Return will be two coefficient arrays which are a1 and a0.
+                f(x) = a0 + a1x
+        """
+        return self._a1, self._a0
+
+    def standartErrorEstimate(self):
+        """
+        This function return correlation coefficient of Linear Regression 
+        of each series.
+
+        Return :
+        --------
+                Return will be array of correlation coefficients.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return self._Sxy / np.sqrt(self._Sxx * self._Syy)
+
+    def standardErrors(self):
+        """
+        This function return standard error of coefficients of Linear 
+        Regression of each series.
+
+        Return :
+        --------
+                Return will be two arrays which are standard errors of 
+                a1 and a0.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            s2 = np.maximum(self._Syy - self._a1 * self._Sxy, 0) / (self._n - 2)
+            sa1 = np.sqrt(s2 / self._Sxx)
+            sa0 = np.sqrt(s2 * (1 / self._n + self._meanX**2 / self._Sxx))
+        return sa1, sa0
+
+
+
+class BatchExponentialRegression(BatchLinearRegression):
+    """
+    This class written for Exponential Regression of many independent 
+    series at once. Same as BatchLinearRegression applied to log of y.
+
+    Arguments :
+        -------------
+        xValues = x values of data. Shape (nPoints) if all series share 
+        x values, otherwise (nSeries, nPoints).
+
+        yValues = y values of data. Shape (nSeries, nPoints).
+
+        mode = Type of exponential.
+
+            exp = A*exp(Bx)
+
+            nexp = A*B^(x)
+
+        mask = optional boolean array, False points are ignored. Points 
+        which x or y is NaN are also ignored.
+
+    \n Class has 3 methods. \n
+        - results() : Return of coefficient arrays.
+        - standartErrorEstimate() : Return of correlation coefficient array
+        of linearized fit.
+        - standardErrors() : Return of standard error of coefficients.
+
+        @Usage :
+        ...
+        cf = BatchExponentialRegression(xValues, yValues, 'exp')
+        A, B = cf.results()
+        ...
+
+    """
+    def __init__(self, xValues, yValues, mode='exp', mask=None):
+        self._mode = mode.lower()
+        super().__init__(xValues, yValues, mask)
+
+    def _transform(self, y, w):
+        return np.log(np.where(w > 0, y, 1.))
+
+    def results(self):
+        """
+        This function return coefficients of Exponential Regression of 
+        each series.
+
+        Return :
+        --------
+                Return will be two coefficient arrays which are A and B.
+    
+                for mode 'exp' :
+                    
+                    f(x) = A * exp(Bx)
+
+                for mode 'nexp' :
+
+                    f(x) = A * B^(x)
+        """
+        a1, a0 = super().results()
+        A = np.exp(a0)
         if self._mode == 'exp':
             B = a1
         else:
             B = np.exp(a1)
+        return A, B
+
+    def standardErrors(self):
+        """
+        This function return standard error of coefficients of Exponential
+        Regression of each series. Errors propagated from linearized fit 
+        with first order approximation.
+
+        Return :
+        --------
+                Return will be two arrays which are standard errors of 
+                A and B.
+        """
+        sa1, sa0 = super().standardErrors()
+        A, B = self.results()
+        if self._mode == 'exp':
+            return A * sa0, sa1
+        return A * sa0, B * sa1
+
+
+
+class BatchPolynomialRegression():
+    """
+    This class written for Polynomial Regression of many independent 
+    series at once. Each series x values are centered and scaled, normal 
+    equations of all series built with broadcasting and solved together.
+
+    Arguments :
+        -------------
+        xValues = x values of data. Shape (nPoints) if all series share 
+        x values, otherwise (nSeries, nPoints).
+
+        yValues = y values of data. Shape (nSeries, nPoints).
 
-        return A, B
\ No newline at end of file
+        order = Order of polynomial regression approach.
+
+        mask = optional boolean array, False points are ignored. Points 
+        which x or y is NaN are also ignored.
+
+    \n Class has 3 methods. \n
+        - results() : Return of coefficient array.
+        - standartErrorEstimate() : Return of correlation coefficient array.
+        - standardErrors() : Return of standard error of coefficients.
+
+        @Usage :
+        ...
+        cf = BatchPolynomialRegression(xValues, yValues, order)
+        coeff = cf.results()        # shape (nSeries, order + 1)
+        ...
+
+    """
+    def __init__(self, xValues, yValues, order, mask=None):
+        self._order = order
+        x, y, w = _batchData(xValues, yValues, mask)
+        self.__compute(x, y, w)
+
+    def __compute(self, x, y, w):
+        m = self._order + 1
+        self._n = w.sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            xMin = np.where(w > 0, x, np.inf).min(axis=1)
+            xMax = np.where(w > 0, x, -np.inf).max(axis=1)
+            c = (xMax + xMin) / 2
+            h = (xMax - xMin) / 2
+            h = np.where(h > 0, h, 1.)
+            t = (x - c[:, np.newaxis]) / h[:, np.newaxis]
+            # Power sums of t build Hankel normal matrix of each series.
+            powers = np.empty((x.shape[0], 2 * m - 1))
+            rhs = np.empty((x.shape[0], m))
+            tk = w.copy()
+            for k in range(2 * m - 1):
+                powers[:, k] = tk.sum(axis=1)
+                if k < m:
+                    rhs[:, k] = (tk * y).sum(axis=1)
+                tk *= t
+            idx = np.arange(m)
+            G = powers[:, idx[:, np.newaxis] + idx]
+            # G is singular when series has less than m distinct x values,
+            # coefficients of those series are left as NaN.
+            xs = np.sort(np.where(w > 0, x, np.nan), axis=1)
+            distinct = (self._n > 0) + (np.diff(xs, axis=1) > 0).sum(axis=1)
+            ok = distinct >= m
+            Ginv = np.full(G.shape, np.nan)
+            Ginv[ok] = np.linalg.inv(G[ok])
+            b = np.einsum('sij,sj->si', Ginv, rhs)
+            # residuals in scaled variable.
+            fit = np.zeros(t.shape)
+            for k in range(m - 1, -1, -1):
+                fit = fit * t + b[:, k:k + 1]
+            res = w * (y - fit)
+            self._SSE = np.einsum('ij,ij->i', res, res)
+            meanY = (w * y).sum(axis=1) / self._n
+            dy = w * (y - meanY[:, np.newaxis])
+            self._SST = np.einsum('ij,ij->i', dy, dy)
+            s2 = self._SSE / (self._n - m)
+            # map coefficients from t = (x - c) / h back to x.
+            T = np.zeros(G.shape)
+            for k in range(m):
+                for j in range(k + 1):
+                    T[:, j, k] = factorial(k) // (factorial(j) * factorial(k - j)) * (-c)**(k - j) / h**k
+            self._a = np.einsum('sjk,sk->sj', T, b)
+            cov = s2[:, np.newaxis, np.newaxis] * np.einsum('sjk,skl,sml->sjm', T, Ginv, T)
+            self._se = np.sqrt(np.einsum('sjj->sj', cov))
+
+    def results(self):
+        """
+        This function return coefficients of Polynomial Regression of 
+        each series.
+
+        Return :
+        --------
+                Return will be array of coefficients, shape 
+                (nSeries, order + 1).
+                f(x) = a0 + a1x + a2x^2 + ...
+        """
+        return self._a
+
+    def standartErrorEstimate(self):
+        """
+        This function return correlation coefficient of Polynomial 
+        Regression of each series.
+
+        Return :
+        --------
+                Return will be array of correlation coefficients.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.sqrt(np.maximum(1 - self._SSE / self._SST, 0))
+
+    def standardErrors(self):
+        """
+        This function return standard error of coefficients of Polynomial 
+        Regression of each series.
+
+        Return :
+        --------
+                Return will be array of standard errors, shape 
+                (nSeries, order + 1).
+        """
+        return self._se
+
+
+
+class RollingRegression():
+    """
+    This class written for Polynomial (and Linear) Regression over sliding 
+    windows of long series in O(n). 
+
+    Sums of the regression (sumX, sumY, sumXY, sumXSq, sumYSq and higher 
+    powers for order > 1) are carried from window to window by adding new 
+    sample and dropping old one, which is done vectorized with cumulative 
+    sums. Cumulative sums restarted (re-summed) every `resumEvery` samples 
+    with a new local origin of x at middle of the block, so round-off 
+    drift and cancellation in power sums are bounded.
+
+    Arguments :
+        -------------
+        xValues = x values of data.
+
+        yValues = y values of data.
+
+        window = number of data points in each window.
+
+        order = Order of polynomial regression approach. Default is 1 
+        (linear regression).
+
+        resumEvery = number of samples after sums are re-summed. It is 
+        limited between window and 2 * window. Default is window.
+
+        @Note : Coefficients are w.r.t powers of x, for high order and 
+        x values far from zero, shift x values before regression.
+
+    \n Class has 2 methods. \n
+        - results() : Return of coefficient array of each window.
+        - standartErrorEstimate() : Return of correlation coefficient array.
+
+        @Usage :
+        ...
+        cf = RollingRegression(xValues, yValues, window)
+        coeff = cf.results()        # shape (n - window + 1, order + 1)
+        a0, a1 = coeff[:, 0], coeff[:, 1]
+        r = cf.standartErrorEstimate()
+        ...
+
+    """
+    def __init__(self, xValues, yValues, window, order=1, resumEvery=None):
+        self._xValues = np.asarray(xValues, dtype=np.float64)
+        self._yValues = np.asarray(yValues, dtype=np.float64)
+        self._n = len(self._xValues)
+        self._window = int(window)
+        self._order = order
+        # larger blocks lose accuracy in power sums, block is capped to 
+        # 2 * window.
+        self._block = min(max(int(resumEvery or window), self._window), 2 * self._window)
+        if len(self._yValues) != self._n:
+            raise Exception("Length of x and y should be same.")
+        if self._window < order + 1 or self._window > self._n:
+            raise Exception("Regression cannot process, check window or number of data not enough.")
+        self.__compute()
+
+    def __shiftSums(self, S, d):
+        # Move power sums from origin t to origin t - d:
+        # sum (t + d)^p = sum_j C(p, j) d^(p - j) sum t^j
+        m = self._order + 1
+        res = S.copy()
+        for p in range(1, 2 * m - 1):
+            res[:, p] = 0
+            for j in range(p + 1):
+                res[:, p] += self.__comb[p][j] * d**(p - j) * S[:, j]
+        off = 2 * m - 1
+        for p in range(1, m):
+            res[:, off + p] = 0
+            for j in range(p + 1):
+                res[:, off + p] += self.__comb[p][j] * d**(p - j) * S[:, off + j]
+        return res
+
+    def __compute(self):
+        n, w, B, m = self._n, self._window, self._block, self._order + 1
+        x = self._xValues
+        self._meanY = self._yValues.mean()
+        y = self._yValues - self._meanY
+        self._h = (x[-1] - x[0]) * (w - 1) / (n - 1) / 2 if n > 1 else 1.
+        if self._h == 0:
+            self._h = 1.
+        self.__comb = [[factorial(p) // (factorial(j) * factorial(p - j)) for j in range(p + 1)] 
+                       for p in range(2 * m - 1)]
+        nb = -(-n // B)
+        blockId = np.arange(n) // B
+        # local origin at middle of each block keeps |t| small
+        origin = x[np.minimum(np.arange(0, n, B) + B // 2, n - 1)]
+        t = (x - origin[blockId]) / self._h
+        # per sample quantities: t^0..t^(2m-2), t^0 y..t^(m-1) y, y^2
+        Q = np.zeros((nb * B, 3 * m))
+        tk = np.ones(n)
+        for p in range(2 * m - 1):
+            Q[:n, p] = tk
+            if p < m:
+                Q[:n, 2 * m - 1 + p] = tk * y
+            tk = tk * t
+        Q[:n, -1] = y * y
+        L = np.cumsum(Q.reshape(nb, B, 3 * m), axis=1)
+        i = np.arange(n - w + 1)
+        k, r = i // B, i % B
+        e = i + w - 1
+        ke, re = e // B, e % B
+        before = np.where((r > 0)[:, np.newaxis], L[k, r - 1], 0.)
+        S = L[ke, re] - np.where((ke == k)[:, np.newaxis], before, 0.)
+        span = ke != k
+        if np.any(span):
+            d = (origin[ke[span]] - origin[k[span]]) / self._h
+            S[span] = self.__shiftSums(S[span], d) + L[k[span], -1] - before[span]
+        idx = np.arange(m)
+        G = S[:, idx[:, np.newaxis] + idx]
+        R = S[:, 2 * m - 1:3 * m - 1]
+        b = np.linalg.solve(G, R[..., np.newaxis])[..., 0]
+        sumY, sumYSq = S[:, 2 * m - 1], S[:, -1]
+        self._SSE = np.maximum(sumYSq - np.einsum('ij,ij->i', b, R), 0)
+        self._SST = sumYSq - sumY**2 / w
+        # map coefficients from t = (x - origin) / h back to x.
+        o = origin[k]
+        b[:, 0] += self._meanY
+        self._a = np.zeros(b.shape)
+        for p in range(m):
+            for j in range(p + 1):
+                self._a[:, j] += self.__comb[p][j] * (-o)**(p - j) / self._h**p * b[:, p]
+
+    def results(self):
+        """
+        This function return coefficients of regression of each window.
+        Row i is the regression of data points i, i+1, ..., i+window-1.
+
+        Return :
+        --------
+                Return will be array of coefficients, shape 
+                (n - window + 1, order + 1).
+                f(x) = a0 + a1x + a2x^2 + ...
+        """
+        return self._a
+
+    def standartErrorEstimate(self):
+        """
+        This function return correlation coefficient of regression of 
+        each window. For order 1, sign of correlation is sign of slope.
+
+        Return :
+        --------
+                Return will be array of correlation coefficients.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r = np.sqrt(np.maximum(1 - self._SSE / self._SST, 0))
+        if self._order == 1:
+            r *= np.sign(self._a[:, 1])
+        return r
+
+
+
+class NonlinearRegression():
+    """
+    This class written for Nonlinear Regression (curve fitting of any 
+    model) with Levenberg-Marquardt method. 
+
+    Damping parameter changed with trust-region like gain ratio. For each 
+    Jacobian, eigen decomposition of column-scaled J^T J computed once and 
+    reused for all damping retries, so retry cost is O(k^2) plus one model 
+    call. If Jacobian function is 
+    not given, forward difference Jacobian computed with one batched model 
+    call. Parameters kept in bounds with projection.
+
+    Arguments :
+        -------------
+        model = Model function f(x, params) which is vectorized over x.
+
+        xValues = x values of curve fitting data.
+
+        yValues = y values of curve fitting data.
+
+        p0 = initial guess of parameters.
+
+        jac = Jacobian function J(x, params) which return array with shape 
+        (number of data, number of parameters). Optional.
+
+        bounds = (lower, upper) bounds of parameters. Optional.
+
+        maxIt = maximum iteration number. Default is 100.
+
+        tol = Desired relative tolerance of parameters and cost. 
+        Default is 1e-10.
+
+        batched = If True, finite difference Jacobian computed with one model 
+        call with params of shape (k, k) and x with new last axis, so model 
+        should broadcast like `p[0] * np.exp(p[1] * x)`. If False, model 
+        called once for each parameter. Default is True.
+
+    \n Class has 3 methods. \n
+        - results() : Return of parameters.
+        - standardErrors() : Return of standard error of parameters.
+        - predict(x) : Return of values of fitted model at x.
+
+        @Usage :
+        ...
+        def f(x, p):
+            return p[0] * np.exp(-p[1] * x) + p[2]
+
+        cf = NonlinearRegression(f, xValues, yValues, [1., 0.1, 0.])
+        A, B, C = cf.results()
+        ...
+
+    """
+    def __init__(self, model, xValues, yValues, p0, jac=None, bounds=None, 
+                 maxIt=100, tol=1e-10, batched=True):
+        self._model = model
+        self._xValues = np.asarray(xValues, dtype=np.float64)
+        self._yValues = np.asarray(yValues, dtype=np.float64)
+        self._jac = jac
+        self._batched = batched
+        self._maxIt = maxIt
+        self._tol = tol
+        k = len(p0)
+        if bounds is None:
+            bounds = (-np.inf, np.inf)
+        self._lower = np.broadcast_to(np.asarray(bounds[0], dtype=np.float64), (k,))
+        self._upper = np.broadcast_to(np.asarray(bounds[1], dtype=np.float64), (k,))
+        if np.any(self._lower >= self._upper):
+            raise Exception("Lower bounds should be smaller than upper bounds.")
+        self._p = np.clip(np.array(p0, dtype=np.float64), self._lower, self._upper)
+        self.__compute()
+
+    def __residual(self, p):
+        self._nFev += 1
+        return np.asarray(self._model(self._xValues, p), dtype=np.float64) - self._yValues
+
+    def __jacobian(self, p, r):
+        if self._jac is not None:
+            return np.asarray(self._jac(self._xValues, p), dtype=np.float64)
+        k = len(p)
+        h = np.sqrt(np.finfo(np.float64).eps) * np.maximum(np.abs(p), 1.)
+        h = np.where(p + h > self._upper, -h, h)
+        f0 = r + self._yValues
+        if self._batched:
+            P = p[:, np.newaxis] + np.diag(h)
+            self._nFev += 1
+            F = np.asarray(self._model(self._xValues[..., np.newaxis], P), dtype=np.float64)
+            return (F - f0[..., np.newaxis]) / h
+        J = np.empty((len(r), k))
+        for j in range(k):
+            pj = p.copy()
+            pj[j] += h[j]
+            J[:, j] = (self.__residual(pj) + self._yValues - f0) / h[j]
+        return J
+
+    def __compute(self):
+        p = self._p
+        self._nFev = 0
+        r = self.__residual(p)
+        cost = r @ r / 2
+        lam, nu = None, 2.
+        scale = np.zeros(len(p))
+        self._converged = False
+        self._J = None
+        for self._it in range(1, self._maxIt + 1):
+            J = self.__jacobian(p, r)
+            g = J.T @ r
+            if np.max(np.abs(g)) <= self._tol * max(cost, np.finfo(np.float64).tiny):
+                self._converged = True
+                break
+            # (J^T J) / scale^2 = V diag(s^2) V^T, computed once and reused 
+            # for all damping values.
+            G = J.T @ J
+            scale = np.maximum(scale, np.sqrt(np.diag(G)))
+            scale[scale == 0] = 1.
+            s2, V = np.linalg.eigh(G / np.outer(scale, scale))
+            s2 = np.maximum(s2, 0)
+            Vg = V.T @ (g / scale)
+            if lam is None:
+                lam = 1e-3 * s2[-1]
+            while True:
+                step = -(V @ (Vg / (s2 + lam))) / scale
+                pNew = np.clip(p + step, self._lower, self._upper)
+                step = pNew - p
+                rNew = self.__residual(pNew)
+                costNew = rNew @ rNew / 2
+                predicted = -(g @ step + step @ G @ step / 2)
+                rho = (cost - costNew) / predicted if predicted > 0 else -1.
+                if rho > 1e-4:
+                    lam *= max(1 / 3, 1 - (2 * rho - 1)**3)
+                    nu = 2.
+                    break
+                lam *= nu
+                nu *= 2
+                if np.linalg.norm(step) <= self._tol * (np.linalg.norm(p) + self._tol):
+                    break
+            small = np.linalg.norm(step) <= self._tol * (np.linalg.norm(p) + self._tol)
+            if rho > 1e-4:
+                dCost = cost - costNew
+                p, r, cost = pNew, rNew, costNew
+                if dCost <= self._tol * cost:
+                    small = True
+            else:
+                self._J = J
+            if small:
+                self._converged = True
+                break
+        self._p, self._r, self._cost = p, r, cost
+
+    def results(self):
+        """
+        This function return parameters of Nonlinear Regression.
+
+        Return :
+        --------
+                Return will be array of parameters.
+
+            @Usage :
+            ...
+            cf = NonlinearRegression(f, xValues, yValues, p0)
+            params = cf.results()
+            ...
+        """
+        return self._p
+
+    def standardErrors(self):
+        """
+        This function return standard error of parameters of Nonlinear 
+        Regression from linearized model at solution.
+
+        Return :
+        --------
+                Return will be array of standard errors.
+        """
+        if self._J is None:
+            self._J = self.__jacobian(self._p, self._r)
+        n, k = self._J.shape
+        s2 = 2 * self._cost / (n - k)
+        _, sv, Vt = np.linalg.svd(self._J, full_matrices=False)
+        cov = (Vt.T / sv**2) @ Vt
+        return np.sqrt(s2 * np.diag(cov))
+
+    def predict(self, x):
+        """
+        This function return values of fitted model.
+
+        Arguments :
+        -------------
+            x = x values which model evaluated.
+
+        Return :
+        --------
+                Return will be array of values.
+        """
+        return self._model(np.asarray(x, dtype=np.float64), self._p)
@@ -3,10 +3,13 @@ Author  : Mehmet Gokcay Kabatas
 Mail    : mgokcaykdev@gmail.com
 Version : 0.1
 Date    : 13/12/2019
-Update  : 16/12/2019
+Update  : 19/10/2026
 Python  : 3.6.5
 
-Update Note : Adding descriptions.
+Update Note : Integration with data rewritten with numpy and chunked 
+              (streaming) processing. Adding CumulativeTrapezoid.
+              Adding Filon and Levin methods for oscillatory integrands.
+              Adding Clenshaw-Curtis method.
 
 This script written by @Author for personal usage. 
 
@@ -29,6 +32,9 @@ class OneDIntegralwithFunction():
         - Romberg
         - Adaptive Quadrature
         - Two Point Gauss Legendre
+        - Filon (oscillatory integrand)
+        - Levin (oscillatory integrand)
+        - Clenshaw-Curtis
 
         @Usage : 
         ...
@@ -295,6 +301,241 @@ class OneDIntegralwithFunction():
         """ 
         return (Fxdx(-1/(3**0.5)) - Fxdx(1/(3**0.5)))
 
+    def __oscWeight(self, res, weight):
+        # scalar omega gives Python float (complex for 'exp').
+        weight = weight.lower()
+        if weight == 'exp':
+            pass
+        elif weight == 'cos':
+            res = res.real
+        elif weight == 'sin':
+            res = res.imag
+        else:
+            raise Exception("Weight should be 'sin', 'cos' or 'exp'.")
+        return res.item() if res.ndim == 0 else res
+
+    def __filonMoments(self, theta):
+        # Moments m_k = integral of t^k * exp(i*theta*t) over [-1, 1] for 
+        # k = 0, 1, 2. Taylor series used for small theta to avoid 
+        # cancellation.
+        theta = np.asarray(theta, dtype=np.float64)
+        small = np.abs(theta) < 1
+        th = np.where(small, 1., theta)
+        s, c = np.sin(th), np.cos(th)
+        m0 = 2 * s / th + 0j
+        m1 = 2j * (s / th**2 - c / th)
+        m2 = 2 * s / th + 4 * c / th**2 - 4 * s / th**3 + 0j
+        if np.any(small):
+            ts = theta[small]
+            sm = [np.zeros(ts.shape, dtype=np.complex128) for k in range(3)]
+            term = np.ones(ts.shape, dtype=np.complex128)
+            for j in range(20):
+                if j > 0:
+                    term = term * 1j * ts / j
+                for k in range(3):
+                    if (k + j) % 2 == 0:
+                        sm[k] += term * 2 / (k + j + 1)
+            m0[small], m1[small], m2[small] = sm
+        return m0, m1, m2
+
+    def Filon(self, l, u, n, Fxdx, omega, weight='sin'):
+        """
+            This function calculate Filon (Filon-Simpson) method w.r.t func
+            for oscillatory integrand Fxdx(x) * weight(omega * x).
+
+            Smooth part of integrand (Fxdx) is approximated with piecewise
+            quadratics and multiplied with weight integrated exactly, so
+            cost does not depend on omega. Fxdx evaluated once for all 
+            omega values.
+
+            @Note : Fxdx should accept numpy array.
+
+            Arguments :
+            -------------
+                l = lower boundary of integral.
+
+                u = upper boundary of integral.
+
+                n = number of segments. Should be even.
+
+                Fxdx = smooth part of integrand.
+
+                omega = frequency. Can be array of frequencies.
+
+                weight = weight function. 'sin', 'cos' or 'exp'. 
+                'exp' means exp(i * omega * x). Default is 'sin'.
+
+            Return :
+            --------
+                Value of integrated function. If omega is array, result 
+                is array with same shape.
+
+                @Usage :
+                ...
+                def f(x):
+                    return x**2
+
+                integral = OneDIntegralwithFunction()
+                integral = Filon(l, u, n, f, omega, 'sin')
+                integral = Filon(l, u, n, f, [10., 100., 1000.], 'cos')
+                ...
+        """
+        if n < 2 or n % 2 != 0:
+            raise Exception("Number of segments (n) should be even.")
+        x = np.linspace(l, u, n + 1)
+        f = np.broadcast_to(np.asarray(Fxdx(x)), x.shape)
+        f0, f1, f2 = f[0:-2:2], f[1:-1:2], f[2::2]
+        h = (u - l) / n
+        om = np.asarray(omega, dtype=np.float64)
+        w = om.reshape(-1, 1)
+        m0, m1, m2 = self.__filonMoments(w * h)
+        panel = f1 * m0 + (f2 - f0) / 2 * m1 + (f0 - 2 * f1 + f2) / 2 * m2
+        res = h * np.sum(np.exp(1j * w * x[1:-1:2]) * panel, axis=1)
+        return self.__oscWeight(res.reshape(om.shape), weight)
+
+    def Levin(self, l, u, n, Fxdx, omega, weight='sin'):
+        """
+            This function calculate Levin collocation method w.r.t func
+            for oscillatory integrand Fxdx(x) * weight(omega * x).
+
+            Method find polynomial p which satisfy p' + i*omega*p = Fxdx
+            at n + 1 Chebyshev points, then integral is 
+            p(u)exp(i*omega*u) - p(l)exp(i*omega*l). Cost does not depend 
+            on omega and accuracy increase while omega increase. Fxdx 
+            evaluated once for all omega values.
+
+            @Note : Fxdx should accept numpy array. omega should not be 
+            zero, for very small omega * (u - l) prefer Filon.
+
+            Arguments :
+            -------------
+                l = lower boundary of integral.
+
+                u = upper boundary of integral.
+
+                n = degree of collocation polynomial.
+
+                Fxdx = smooth part of integrand.
+
+                omega = frequency. Can be array of frequencies.
+
+                weight = weight function. 'sin', 'cos' or 'exp'. 
+                'exp' means exp(i * omega * x). Default is 'sin'.
+
+            Return :
+            --------
+                Value of integrated function. If omega is array, result 
+                is array with same shape.
+
+                @Usage :
+                ...
+                def f(x):
+                    return x**2
+
+                integral = OneDIntegralwithFunction()
+                integral = Levin(l, u, n, f, omega, 'sin')
+                ...
+        """
+        om = np.asarray(omega, dtype=np.float64)
+        if np.any(om == 0):
+            raise Exception("Levin method need non-zero omega.")
+        t = np.cos(np.pi * np.arange(n + 1) / n)
+        x = (l + u) / 2 + (u - l) / 2 * t
+        f = np.broadcast_to(np.asarray(Fxdx(x)), x.shape).astype(np.complex128)
+        # Chebyshev differentiation matrix for nodes x.
+        c = np.ones(n + 1)
+        c[0] = c[-1] = 2
+        c *= (-1.) ** np.arange(n + 1)
+        dt = t.reshape(-1, 1) - t + np.eye(n + 1)
+        D = np.outer(c, 1 / c) / dt
+        D -= np.diag(np.sum(D, axis=1))
+        D *= 2 / (u - l)
+        w = om.reshape(-1, 1, 1)
+        A = D + 1j * w * np.eye(n + 1)
+        B = np.broadcast_to(f, (A.shape[0], n + 1))[..., np.newaxis]
+        p = np.linalg.solve(A, B)[..., 0]
+        w = w[:, 0, 0]
+        res = p[:, 0] * np.exp(1j * w * u) - p[:, -1] * np.exp(1j * w * l)
+        return self.__oscWeight(res.reshape(om.shape), weight)
+
+
+    _ccWeights = {}
+
+    def __dct1(self, g):
+        # Sum''_k g_k cos(j*k*pi/N) for j = 0..N with FFT of even extension.
+        N = len(g) - 1
+        ext = np.concatenate((g, g[-2:0:-1]))
+        return np.fft.rfft(ext).real[:N + 1] / 2
+
+    def __clenshawCurtisWeights(self, N):
+        # Weights for nodes cos(j*pi/N) on [-1, 1], memoized per N.
+        w = self._ccWeights.get(N)
+        if w is None:
+            k = np.arange(N + 1)
+            m = np.zeros(N + 1)
+            m[::2] = 2 / (1 - k[::2]**2)
+            w = 2 / N * self.__dct1(m)
+            w[0] /= 2 ; w[-1] /= 2
+            self._ccWeights[N] = w
+        return w
+
+    def ClenshawCurtis(self, l, u, Fxdx, n=16, tol=1e-12, maxN=2**16):
+        """
+            This function calculate Clenshaw-Curtis method w.r.t func.
+
+            Function evaluated at Chebyshev points cos(j*pi/n). Weights 
+            computed with FFT and memoized per n. If estimated error is 
+            bigger than tol, n doubled and previous function values 
+            reused since Chebyshev points nest. Error estimated from 
+            tail of Chebyshev coefficients.
+
+            @Note : Fxdx should accept numpy array.
+
+            Arguments :
+            -------------
+                l = lower boundary of integral.
+
+                u = upper boundary of integral.
+
+                Fxdx = integrate function.
+
+                n = initial number of segments. Default is 16.
+
+                tol = desired error. Default is 1e-12.
+
+                maxN = maximum number of segments. Default is 2^16.
+
+            Return :
+            --------
+                Value of integrated function and estimated error.        
+
+                @Usage :
+                ...
+                def f(x):
+                    return x**2
+
+                integral = OneDIntegralwithFunction()
+                integral, err = ClenshawCurtis(l, u, f)
+                ...
+        """
+        N = max(int(n), 2)
+        mid, rad = (l + u) / 2, (u - l) / 2
+        t = np.cos(np.pi * np.arange(N + 1) / N)
+        f = np.broadcast_to(np.asarray(Fxdx(mid + rad * t), dtype=np.float64), t.shape)
+        while True:
+            I = rad * np.dot(self.__clenshawCurtisWeights(N), f)
+            a = 2 / N * self.__dct1(f)
+            a[-1] /= 2
+            err = abs(rad) * 2 * np.max(np.abs(a[-4:]))
+            if err <= tol or 2 * N > maxN:
+                return I, err
+            N *= 2
+            t = np.cos(np.pi * np.arange(1, N, 2) / N)
+            fNew = np.empty(N + 1)
+            fNew[::2] = f
+            fNew[1::2] = np.asarray(Fxdx(mid + rad * t), dtype=np.float64)
+            f = fNew
+
 
 class OneDIntegralwithData():
     """
@@ -306,6 +547,13 @@ class OneDIntegralwithData():
         - TrapezoidUnequalSegments
         - Simpson's 1/3 == SimpsonOneThird
         - Romberg
+        - CumulativeTrapezoid
+
+        @Note : Data can be given as arrays (lists, numpy arrays or 
+        memory-mapped arrays), as path of `.npy` files or as iterator of 
+        (x, y) chunks. Data is processed chunk by chunk in a single pass, 
+        boundary sample carried between chunks, so data which is larger 
+        than memory can be integrated.
 
         @Usage : 
         ...
@@ -314,12 +562,50 @@ class OneDIntegralwithData():
         ...
 
     """
-    
-    def Trapezoid(self, x, y):
+
+    def __init__(self, chunkSize=2**20):
+        self._chunkSize = int(chunkSize)
+
+    def __load(self, values):
+        if isinstance(values, str):
+            return np.load(values, mmap_mode='r')
+        if isinstance(values, np.ndarray):
+            return values
+        return np.asarray(values, dtype=np.float64)
+
+    def __chunks(self, x, y):
+        """
+            Yield (x, y) chunks as float64 arrays. Each chunk starts with 
+            last sample of previous chunk, so no interval lost between chunks.
+        """
+        if y is None:
+            source = ((np.asarray(xc, dtype=np.float64), 
+                       np.asarray(yc, dtype=np.float64)) for xc, yc in x)
+        else:
+            x, y = self.__load(x), self.__load(y)
+            if len(x) != len(y):
+                raise Exception("Length of x and y should be same.")
+            source = ((np.asarray(x[i:i + self._chunkSize], dtype=np.float64),
+                       np.asarray(y[i:i + self._chunkSize], dtype=np.float64))
+                       for i in range(0, len(x), self._chunkSize))
+        lastX, lastY = None, None
+        for xc, yc in source:
+            if len(xc) != len(yc):
+                raise Exception("Length of x and y chunks should be same.")
+            if len(xc) == 0:
+                continue
+            if lastX is not None:
+                xc = np.concatenate(([lastX], xc))
+                yc = np.concatenate(([lastY], yc))
+            lastX, lastY = xc[-1], yc[-1]
+            yield xc, yc
+
+    def Trapezoid(self, x, y=None):
         """
             This function calculate Trapezoid method w.r.t data.
 
-            @Note : x and y should be array.
+            @Note : x and y should be array. Segments can be unequal.
+            If y is None, x should be iterator of (x, y) chunks.
 
             Arguments :
             -------------
@@ -340,24 +626,18 @@ class OneDIntegralwithData():
                 integral = Trapezoid(x,y)
                 ...
         """
-        sum = 0 
-        wd = max(x) - min(x)
-        f0 = min(x)
-        f0ind = x.index(f0)
-        f2 = max(x)
-        f2ind = x.index(f2)
-        for i in range(len(x)):
-            if (i!=f0ind) and (i!=f2ind):
-                sum += x[i]
-        I =  wd * (f0 + 2 * sum + f2) / (2*(len(x)))
+        I = 0.
+        for xc, yc in self.__chunks(x, y):
+            I += np.dot(np.diff(xc), yc[1:] + yc[:-1]) / 2
         return I
 
-    def TrapezoidUnequalSegments(self, x, y):
+    def TrapezoidUnequalSegments(self, x, y=None):
         """
             This function calculate Trapezoid Unequal Segments
              method w.r.t data.
 
-            @Note : x and y should be array.
+            @Note : x and y should be array. Same as Trapezoid which 
+            also handle unequal segments.
 
             Arguments :
             -------------
@@ -378,18 +658,25 @@ class OneDIntegralwithData():
                 integral = TrapezoidUnequalSegments(x,y)
                 ...
         """
-        sum = 0
-        for i in range(1,len(x)):
-            temp = y[i] - y[i - 1]
-            temp /= 2
-            sum += (x[i]-x[i-1]) * temp
-        return sum
+        return self.Trapezoid(x, y)
+
+    def __simpson(self, x, y):
+        # Composite Simpson's 1/3 on pairs of (possibly unequal) segments.
+        h = np.diff(x)
+        h0, h1 = h[0::2], h[1::2]
+        hs = h0 + h1
+        hr = h1 / h0
+        f0, f1, f2 = y[0:-2:2], y[1:-1:2], y[2::2]
+        return np.sum(hs / 6 * ((2 - hr) * f0 + hs**2 / (h0 * h1) * f1 + (2 - 1 / hr) * f2))
         
-    def SimpsonOneThird(self, x, y):
+    def SimpsonOneThird(self, x, y=None):
         """
             This function calculate Simpson's 1/3 method w.r.t data.
 
-            @Note : x and y should be array.
+            @Note : x and y should be array. Segments can be unequal.
+            If number of segments is odd, last segment is integrated 
+            with parabola of last three points. If y is None, x should 
+            be iterator of (x, y) chunks.
 
             Arguments :
             -------------
@@ -410,25 +697,39 @@ class OneDIntegralwithData():
                 integral = SimpsonOneThird(x,y)
                 ...
         """
-        wd = max(x) - min(x)
-        f0 = min(x)
-        f0ind = x.index(f0)
-        f2 = max(x)
-        f2ind = x.index(f2)
-        f11, f12 = 0, 0
-        for i in range(len(x)):
-            if (i!=f0ind) and (i!=f2ind):
-                if (i % 2 == 0):
-                    f12 += x[i]
-                else:
-                    f11 += x[i]
-        return wd * (f0 + 4 * f11 + 2 * f12 + f2) / (3*len(x))
+        I = 0.
+        prevX, prevY = None, None
+        carryX, carryY = np.empty(0), np.empty(0)
+        for xc, yc in self.__chunks(x, y):
+            # chunk starts with last sample of previous chunk, drop it since
+            # carry already ends with it.
+            if len(carryX):
+                xc, yc = xc[1:], yc[1:]
+            xc = np.concatenate((carryX, xc))
+            yc = np.concatenate((carryY, yc))
+            m = (len(xc) - 1) // 2 * 2
+            if m > 0:
+                I += self.__simpson(xc[:m + 1], yc[:m + 1])
+                prevX, prevY = xc[m - 1], yc[m - 1]
+            carryX, carryY = xc[m:], yc[m:]
+        if len(carryX) == 2:
+            if prevX is None:
+                return (carryX[1] - carryX[0]) * (carryY[0] + carryY[1]) / 2
+            h0, h1 = carryX[0] - prevX, carryX[1] - carryX[0]
+            alpha = (2 * h1**2 + 3 * h0 * h1) / (6 * (h0 + h1))
+            beta = (h1**2 + 3 * h0 * h1) / (6 * h0)
+            eta = h1**3 / (6 * h0 * (h0 + h1))
+            I += alpha * carryY[1] + beta * carryY[0] - eta * prevY
+        return I
 
     def Romberg(self, x, y, maxIt):
         """
             This function calculate Romberg method w.r.t data.
 
-            @Note : x and y should be array.
+            @Note : x and y should be array. Data should be equally spaced.
+            Each level of Romberg uses every 2^(maxIt-level) th data point,
+            so number of segments should be divisible by 2^(maxIt-1),
+            ex: 2^k + 1 data points. Otherwise maxIt is reduced.
 
             Arguments :
             -------------
@@ -451,16 +752,81 @@ class OneDIntegralwithData():
                 integral = Romberg(x,y,maxIt)
                 ...
         """
+        x, y = self.__load(x), self.__load(y)
+        if len(x) != len(y):
+            raise Exception("Length of x and y should be same.")
+        if len(x) < 2:
+            raise Exception("Romberg with data need at least 2 data points.")
+        levels = 1
+        while (len(x) - 1) % 2**levels == 0:
+            levels += 1
+        maxIt = min(maxIt, levels)
         I = np.empty((maxIt,maxIt))
-        n = 0
-        I[0][0] = self.Trapezoid(x,y)
         for cnt in range(maxIt):
-            n = 2**cnt
-            I[cnt][0] = self.Trapezoid(x,y)
+            step = 2**(maxIt - 1 - cnt)
+            I[cnt][0] = self.Trapezoid(x[::step], y[::step])
             for k in range(1,cnt+1):
                 j = cnt - k
                 I[j][k] = (4**(k) * I[j+1][k-1]-I[j][k-1])/ (4**(k)-1)
         return I[0][-1]
+
+    def CumulativeTrapezoid(self, x, y=None, initial=0., out=None):
+        """
+            This function calculate cumulative integral with Trapezoid 
+            method w.r.t data.
+
+            @Note : x and y should be array. If y is None, x should 
+            be iterator of (x, y) chunks. For data larger than memory, 
+            `out` can be memory-mapped array.
+
+            Arguments :
+            -------------
+                x = x values of data.
+
+                y = y values of data.
+
+                initial = value of integral at first data point.
+
+                out = optional array which result written to. Length 
+                should be same with data.
+
+            Return :
+            --------
+                Array of integrated values at each data point.        
+
+                @Usage :
+                ...
+                x = [...]
+                y = [...]
+
+                integral = OneDIntegralwithData()
+                I = CumulativeTrapezoid(x,y)
+                out = np.lib.format.open_memmap('I.npy', 'w+', np.float64, (len(x),))
+                I = CumulativeTrapezoid('x.npy', 'y.npy', out=out)
+                ...
+        """
+        res = []
+        pos = 0
+        total = float(initial)
+        for xc, yc in self.__chunks(x, y):
+            if pos == 0:
+                part = np.empty(len(xc))
+                part[0] = total
+                part[1:] = total + np.cumsum(np.diff(xc) * (yc[1:] + yc[:-1]) / 2)
+            else:
+                part = total + np.cumsum(np.diff(xc) * (yc[1:] + yc[:-1]) / 2)
+            if len(part):
+                total = part[-1]
+            if out is None:
+                res.append(part)
+            else:
+                out[pos:pos + len(part)] = part
+            pos += len(part)
+        if out is not None:
+            return out
+        if len(res) == 0:
+            return np.empty(0)
+        return np.concatenate(res)
         
 
 class __TwoDIntegral():
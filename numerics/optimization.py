@@ -3,14 +3,17 @@ Author  : Mehmet Gokcay Kabatas
 Mail    : mgokcaykdev@gmail.com
 Version : 0.1
 Date    : 10/12/2019
-Update  : 16/12/2019
+Update  : 19/10/2026
 Python  : 3.6.5
 
 Update Note : Adding descriptions.
+              Newton uses automatic differentiation when derivatives are 
+              not given.
 
 This script written by @Author for personal usage. 
 
 """
+from numerics.autodiff import *
 
 class OneD():
     """
@@ -150,7 +153,7 @@ class OneD():
                     break
         return args[1]
 
-    def Newton(self, x0, maxIt, der, dder):
+    def Newton(self, x0, maxIt, der=None, dder=None, func=None):
         """ 
         Newton method for optimization.
         
@@ -160,9 +163,13 @@ class OneD():
 
         maxIt = maximum iteration number.
 
-        der = derivative of function.
+        der = derivative of function. If it is None, der and dder found
+        exactly from func with one hyper-dual evaluation.
 
-        dder = seconn derivation of function.
+        dder = seconn derivation of function. If it is None, found 
+        exactly from der with one dual evaluation.
+
+        func = function. Needed only if der is None.
 
         Return :
         --------
@@ -182,11 +189,20 @@ class OneD():
 
             opt = OneD()
             val = opt.Newton(x0, maxIt, df, ddf)
+            val = opt.Newton(x0, maxIt, func=f)
             ...
         
         """
+        if der == None and func == None:
+            raise Exception("Function (func) should be given if der is not given.")
         xNext = 0
         for i in range(maxIt):
-            xNext = x0 - (der([x0]) / dder([x0]))
+            if der == None:
+                f, d, dd = secondDerivative(lambda x: func([x]), x0)
+            elif dder == None:
+                d, dd = derivative(lambda x: der([x]), x0)
+            else:
+                d, dd = der([x0]), dder([x0])
+            xNext = x0 - (d / dd)
             x0 = xNext  
         return xNext
@@ -3,14 +3,42 @@ Author  : Mehmet Gokcay Kabatas
 Mail    : mgokcaykdev@gmail.com
 Version : 0.1
 Date    : 03/12/2019
-Update  : 05/12/2019
+Update  : 19/10/2026
 Python  : 3.6.5
 
-Update Note : Adding Descriptions.
+Update Note : Adding ArrayRootFind for vectorized root finding.
+              Adding Brent method which returns RootResults.
+              Adding NonlinearSystem (Newton / Broyden) for systems.
+              Adding PolynomialRoots for all roots of polynomials.
+              Adding Chandrupatla and AllRoots scanning to ArrayRootFind.
+              NewtonRaphson uses automatic differentiation if der is None.
 
 This script written by @Author for personal usage. 
 
+Prerequest : numpy, scipy (optional, LU reuse in NonlinearSystem)
+
 """
+import numpy as np
+from numerics.autodiff import *
+
+class RootResults():
+    """ Result of bracketing root finders.
+
+        @ Attributes :
+        - root : Found root.
+        - iterations : Number of iterations.
+        - funcCalls : Number of function evaluations.
+        - converged : True if desired tolerance reached.
+    """
+    def __init__(self, root, iterations, funcCalls, converged):
+        self.root = root
+        self.iterations = iterations
+        self.funcCalls = funcCalls
+        self.converged = converged
+
+    def __repr__(self):
+        return ("RootResults(root={}, iterations={}, funcCalls={}, converged={})"
+                .format(self.root, self.iterations, self.funcCalls, self.converged))
 
 class RootFind():
     """ Some analytic function's root cannot find analytically. 
@@ -21,6 +49,7 @@ class RootFind():
         - BiSection
         - Newton - Raphson Method
         - Secant 
+        - Brent
         - Simpe Fixed-Point Iteration (Just named Iteration)
 
         @ Note : 
@@ -57,7 +86,8 @@ class RootFind():
             ...
 
         der : Target function's derivative function
-        which argument also depend on 'x'.
+        which argument also depend on 'x'. If it is None, derivative
+        found exactly with dual numbers (func should use numpy functions).
 
             @ Example :
             def df(x):
@@ -107,7 +137,8 @@ class RootFind():
     def NewtonRaphson(self, x0) -> float:
         """ Newton-Raphson method.
 
-            @Note : Need setted <der> argument in setParams.
+            @Note : If <der> is not setted in setParams, func and its 
+            derivative found with one evaluation of dual number.
 
         Arguments :
         -----------
@@ -122,11 +153,13 @@ class RootFind():
         err = 100
         if self.func == None:
             raise Exception("Function (func) should be declared in setParams.")
-        if self.der == None:
-            raise Exception("Derivative function (der) should be declared in setParams.")
         while ( err > self.err):
-            x_n1 = x0 - (self.func(x0) / self.der(x0))
-            err = abs(self.func(x0) - self.func(x_n1))
+            if self.der == None:
+                f0, df0 = derivative(self.func, x0)
+            else:
+                f0, df0 = self.func(x0), self.der(x0)
+            x_n1 = x0 - (f0 / df0)
+            err = abs(f0 - self.func(x_n1))
             x0 = x_n1        
         return x_n1
 
@@ -155,6 +188,73 @@ class RootFind():
             x1 = x_2       
         return x_2
 
+    def Brent(self, x0, x1, xtol=2e-12, rtol=4*np.finfo(float).eps, maxIter=100):
+        """ Brent method. Bracketing method which combines bisection, 
+        secant and inverse quadratic interpolation steps. Convergence is 
+        guaranteed like bisection, and func called only once per iteration.
+
+        Arguments :
+        -----------
+        
+        x0 : Initial guess. \n
+        x1 : Initial guess. Func(x0) * Func(x1) should be <= 0. \n
+        xtol : Absolute tolerance of root. Default equal 2e-12. \n
+        rtol : Relative tolerance of root. Default equal 4 * eps. \n
+        maxIter : Maximum iteration number. Default equal 100.
+
+        Return :
+        --------
+        result : RootResults which has root, iterations, funcCalls and 
+        converged.
+
+        """
+        if self.func == None:
+            raise Exception("Function (func) should be declared in setParams.")
+        xpre, xcur = x0, x1
+        fpre, fcur = self.func(xpre), self.func(xcur)
+        calls = 2
+        if fpre * fcur > 0:
+            raise Exception('Guess are not proper.\nFunc(x0) * Func(x1) > 0. Select proper guess.')
+        if fpre == 0:
+            return RootResults(xpre, 0, calls, True)
+        if fcur == 0:
+            return RootResults(xcur, 0, calls, True)
+        xblk, fblk, spre, scur = 0., 0., 0., 0.
+        for it in range(1, maxIter + 1):
+            if fpre * fcur < 0:
+                xblk, fblk = xpre, fpre
+                spre = scur = xcur - xpre
+            if abs(fblk) < abs(fcur):
+                xpre, xcur, xblk = xcur, xblk, xcur
+                fpre, fcur, fblk = fcur, fblk, fcur
+            delta = (xtol + rtol * abs(xcur)) / 2
+            sbis = (xblk - xcur) / 2
+            if fcur == 0 or abs(sbis) < delta:
+                return RootResults(xcur, it, calls, True)
+            if abs(spre) > delta and abs(fcur) < abs(fpre):
+                if xpre == xblk:
+                    # secant step
+                    stry = -fcur * (xcur - xpre) / (fcur - fpre)
+                else:
+                    # inverse quadratic interpolation step
+                    dpre = (fpre - fcur) / (xpre - xcur)
+                    dblk = (fblk - fcur) / (xblk - xcur)
+                    stry = -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre))
+                if 2 * abs(stry) < min(abs(spre), 3 * abs(sbis) - delta):
+                    spre, scur = scur, stry
+                else:
+                    spre, scur = sbis, sbis
+            else:
+                spre, scur = sbis, sbis
+            xpre, fpre = xcur, fcur
+            if abs(scur) > delta:
+                xcur += scur
+            else:
+                xcur += delta if sbis > 0 else -delta
+            fcur = self.func(xcur)
+            calls += 1
+        return RootResults(xcur, maxIter, calls, False)
+
     def Iteration(self, x0):
         """ Simple Fixed-Iteration method.
 
@@ -176,3 +276,632 @@ class RootFind():
             err = abs(x_1 - x0) 
             x0 = x_1            
         return x_1
+
+
+
+class ArrayRootFind():
+    """ Vectorized versions of RootFind methods which solve many 
+    independent scalar equations at once. All elements iterated together 
+    with convergence masks, converged elements stop updating and are not 
+    evaluated again.
+
+        @ Methods : 
+        - BiSection
+        - Newton - Raphson Method
+        - Secant 
+        - Chandrupatla (bracketing, like Brent)
+        - AllRoots : All roots in interval by scanning.
+
+        @ Note : 
+        Before use the methods, you need to set some parameters.
+        To do it, you can call `@setParams` method. `func` and `der` should
+        be vectorized. Parameters of each equation can be given with `args`,
+        then only parameters of not converged elements are passed.
+
+        @ Usage :
+        ...
+        def f(x, c):
+            return x**2 - c
+        
+        def df(x, c):
+            return 2*x
+
+        c = np.linspace(1, 100, 10**6)
+        rf = ArrayRootFind()
+        rf.setParams(f, df, args=(c,))
+        roots, iterations, converged = rf.NewtonRaphson(np.ones(10**6))
+        ...
+     """
+
+    def setParams(self, func=None, der=None, err=1e-13, maxIt=100, args=()):
+        """ To find roots, you need to set some properties.
+        
+        Arguments :
+        -------------
+
+        func : Target function which first argument is array 'x'.
+
+        der : Target function's derivative function. If it is None, 
+        derivative found exactly with dual numbers.
+
+        err : Desired error. Element converged when |func(x)| <= err or
+        step of x <= err * max(1, |x|). Default equal 1e-13.
+
+        maxIt : Maximum iteration number. Default equal 100.
+
+        args : Tuple of arrays which are parameters of each equation. They
+        are broadcasted to shape of guesses and passed to func and der 
+        after x.
+
+        """
+        self.func = func
+        self.der = der
+        self.err = err
+        self.maxIt = maxIt
+        self.args = args
+
+    def __prepare(self, *guesses):
+        arrays = np.broadcast_arrays(*[np.asarray(g, dtype=np.float64) for g in guesses],
+                                     *[np.asarray(a) for a in self.args])
+        guesses, self._args = arrays[:len(guesses)], [a.ravel() for a in arrays[len(guesses):]]
+        self._shape = guesses[0].shape
+        n = guesses[0].size
+        self._root = np.full(n, np.nan)
+        self._it = np.zeros(n, dtype=np.intp)
+        self._conv = np.zeros(n, dtype=bool)
+        return [g.ravel().copy() for g in guesses]
+
+    def __call(self, f, x, active):
+        return np.asarray(f(x, *[a[active] for a in self._args]), dtype=np.float64)
+
+    def __result(self):
+        return (self._root.reshape(self._shape), self._it.reshape(self._shape), 
+                self._conv.reshape(self._shape))
+
+    def __small(self, dx, x):
+        return np.abs(dx) <= self.err * np.maximum(1., np.abs(x))
+
+    def BiSection(self, x0, x1):
+        """ Vectorized BiSection method.
+        
+        Arguments :
+        -----------
+        
+        x0 : Array of initial guesses. \n
+        x1 : Array of initial guesses.
+
+        Return :
+        --------
+        x, it, converged : Roots, iteration counts and convergence flags. 
+        Elements which guesses have same sign are not converged and 
+        their roots are NaN.
+
+        """  
+        if self.func == None:
+            raise Exception("Function (func) should be declared in setParams.")
+        x0, x1 = self.__prepare(x0, x1)
+        active = np.arange(x0.size)
+        f0 = self.__call(self.func, x0, active)
+        f1 = self.__call(self.func, x1, active)
+        zero0, zero1 = f0 == 0, f1 == 0
+        self._root[zero1], self._conv[zero1] = x1[zero1], True
+        self._root[zero0], self._conv[zero0] = x0[zero0], True
+        keep = (f0 * f1 < 0)
+        active, x0, x1, f0 = active[keep], x0[keep], x1[keep], f0[keep]
+        for it in range(1, self.maxIt + 1):
+            if len(active) == 0:
+                break
+            x2 = x0 + (x1 - x0) / 2
+            f2 = self.__call(self.func, x2, active)
+            self._it[active] = it
+            self._root[active] = x2
+            done = (np.abs(f2) <= self.err) | self.__small(x1 - x0, x2)
+            self._conv[active[done]] = True
+            left = f0 * f2 > 0
+            x0 = np.where(left, x2, x0)
+            f0 = np.where(left, f2, f0)
+            x1 = np.where(left, x1, x2)
+            keep = ~done
+            active, x0, x1, f0 = active[keep], x0[keep], x1[keep], f0[keep]
+        return self.__result()
+
+    def NewtonRaphson(self, x0):
+        """ Vectorized Newton-Raphson method.
+
+            @Note : If <der> is not setted in setParams, func and its 
+            derivative found with one evaluation of dual number.
+
+        Arguments :
+        -----------
+        
+        x0 : Array of initial guesses. 
+
+        Return :
+        --------
+        x, it, converged : Roots, iteration counts and convergence flags.
+
+        """
+        if self.func == None:
+            raise Exception("Function (func) should be declared in setParams.")
+        x, = self.__prepare(x0)
+        active = np.arange(x.size)
+        for it in range(1, self.maxIt + 1):
+            if len(active) == 0:
+                break
+            if self.der == None:
+                f, df = derivative(lambda v: self.func(v, *[a[active] for a in self._args]), x)
+                f, df = np.asarray(f, dtype=np.float64), np.asarray(df, dtype=np.float64)
+            else:
+                f = self.__call(self.func, x, active)
+                df = self.__call(self.der, x, active)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                dx = f / df
+            xNew = x - dx
+            self._it[active] = it
+            self._root[active] = xNew
+            done = (np.abs(f) <= self.err) | self.__small(dx, xNew)
+            bad = ~np.isfinite(xNew)
+            self._conv[active[done & ~bad]] = True
+            keep = ~(done | bad)
+            active, x = active[keep], xNew[keep]
+        return self.__result()
+
+    def Secant(self, x0, x1):
+        """ Vectorized Secant method.
+
+        Arguments :
+        -----------
+        
+        x0 : Array of initial guesses. \n
+        x1 : Array of initial guesses. 
+
+        Return :
+        --------
+        x, it, converged : Roots, iteration counts and convergence flags.
+
+        """
+        if self.func == None:
+            raise Exception("Function (func) should be declared in setParams.")
+        x0, x1 = self.__prepare(x0, x1)
+        active = np.arange(x0.size)
+        f0 = self.__call(self.func, x0, active)
+        f1 = self.__call(self.func, x1, active)
+        for it in range(1, self.maxIt + 1):
+            if len(active) == 0:
+                break
+            with np.errstate(divide='ignore', invalid='ignore'):
+                x2 = x1 - f1 * (x1 - x0) / (f1 - f0)
+            self._it[active] = it
+            self._root[active] = x2
+            bad = ~np.isfinite(x2)
+            x2s = np.where(bad, x1, x2)
+            f2 = self.__call(self.func, x2s, active)
+            done = ((np.abs(f2) <= self.err) | self.__small(x2s - x1, x2s)) & ~bad
+            self._conv[active[done]] = True
+            keep = ~(done | bad)
+            active = active[keep]
+            x0, f0, x1, f1 = x1[keep], f1[keep], x2s[keep], f2[keep]
+        return self.__result()
+
+    def Chandrupatla(self, x0, x1):
+        """ Vectorized Chandrupatla method. Bracketing method which uses 
+        inverse quadratic interpolation when it is safe, otherwise 
+        bisection. Func called once per iteration.
+        
+        Arguments :
+        -----------
+        
+        x0 : Array of initial guesses. \n
+        x1 : Array of initial guesses.
+
+        Return :
+        --------
+        x, it, converged : Roots, iteration counts and convergence flags. 
+        Elements which guesses have same sign are not converged and 
+        their roots are NaN.
+
+        """  
+        if self.func == None:
+            raise Exception("Function (func) should be declared in setParams.")
+        b, a = self.__prepare(x0, x1)
+        active = np.arange(a.size)
+        fa = self.__call(self.func, a, active)
+        fb = self.__call(self.func, b, active)
+        zeroA, zeroB = fa == 0, fb == 0
+        self._root[zeroB], self._conv[zeroB] = b[zeroB], True
+        self._root[zeroA], self._conv[zeroA] = a[zeroA], True
+        keep = (fa * fb < 0)
+        active, a, b, fa, fb = active[keep], a[keep], b[keep], fa[keep], fb[keep]
+        c, fc = a, fa
+        t = np.full(len(active), 0.5)
+        for it in range(1, self.maxIt + 1):
+            if len(active) == 0:
+                break
+            xt = a + t * (b - a)
+            ft = self.__call(self.func, xt, active)
+            same = np.sign(ft) == np.sign(fa)
+            c, fc = np.where(same, a, b), np.where(same, fa, fb)
+            b, fb = np.where(same, b, a), np.where(same, fb, fa)
+            a, fa = xt, ft
+            smaller = np.abs(fa) < np.abs(fb)
+            xm, fm = np.where(smaller, a, b), np.where(smaller, fa, fb)
+            self._it[active] = it
+            self._root[active] = xm
+            with np.errstate(divide='ignore', invalid='ignore'):
+                tl = self.err * np.maximum(1., np.abs(xm)) / np.abs(b - c)
+                xi = (a - b) / (c - b)
+                phi = (fa - fb) / (fc - fb)
+                iqi = (phi * phi < xi) & ((1 - phi)**2 < 1 - xi)
+                t = np.where(iqi, fa / (fb - fa) * fc / (fb - fc)
+                             + (c - a) / (b - a) * fa / (fc - fa) * fb / (fc - fb), 0.5)
+            t = np.minimum(1 - tl, np.maximum(tl, t))
+            done = (np.abs(fm) <= self.err) | ~(tl <= 0.5)
+            self._conv[active[done]] = True
+            keep = ~done
+            active, t = active[keep], t[keep]
+            a, b, c, fa, fb, fc = a[keep], b[keep], c[keep], fa[keep], fb[keep], fc[keep]
+        return self.__result()
+
+    def AllRoots(self, a, b, n=1024, refine=32, maxLevel=6):
+        """ All roots of func in [a, b]. Func evaluated on grid at once and 
+        sign changes are taken as brackets. Near local minimums of |func| 
+        which may be tangency (or close root pair), grid subdivided again 
+        with batched evaluations. All brackets polished together with 
+        Chandrupatla method. Tangential (double) roots are accepted when 
+        |func| <= err at the vertex of parabola fitted on finest grid.
+
+            @Note : func should be vectorized and `args` should be scalars.
+        
+        Arguments :
+        -----------
+        
+        a, b : Interval. \n
+        n : Number of intervals of initial grid. Default equal 1024. \n
+        refine : Number of subintervals when suspected interval 
+        subdivided. Default equal 32. \n
+        maxLevel : Maximum level of subdivision. Default equal 6.
+
+        Return :
+        --------
+        roots : Sorted array of roots.
+
+        """  
+        if self.func == None:
+            raise Exception("Function (func) should be declared in setParams.")
+        def f(x):
+            return np.asarray(self.func(x, *self.args), dtype=np.float64).reshape(x.shape)
+        # each row is grid of one interval
+        x = np.linspace(a, b, n + 1)[None, :]
+        y = f(x)
+        roots, left, right, tangent = [x[y == 0]], [], [], []
+        for level in range(maxLevel + 1):
+            cross = y[:, :-1] * y[:, 1:] < 0
+            left.append(x[:, :-1][cross])
+            right.append(x[:, 1:][cross])
+            # interior local minimums of |y| without sign change
+            m = np.abs(y)
+            i, j = np.nonzero((m[:, 1:-1] < m[:, :-2]) & (m[:, 1:-1] <= m[:, 2:])
+                              & (y[:, 1:-1] * y[:, :-2] > 0) & (y[:, 1:-1] * y[:, 2:] > 0))
+            if len(i) == 0:
+                break
+            x0, x1, x2 = x[i, j], x[i, j + 1], x[i, j + 2]
+            y0, y1, y2 = y[i, j], y[i, j + 1], y[i, j + 2]
+            # vertex of parabola through three points
+            d0, d1 = (y1 - y0) / (x1 - x0), (y2 - y1) / (x2 - x1)
+            c2 = (d1 - d0) / (x2 - x0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                xv = np.clip((x0 + x1) / 2 - d0 / (2 * c2), x0, x2)
+            xv = np.where(np.isfinite(xv), xv, x1)
+            yv = y1 + (xv - x1) * (d0 + c2 * (xv - x0))
+            suspect = (yv * y1 <= 0) | (np.abs(yv) < 0.5 * np.abs(y1))
+            x0, x2, xv = x0[suspect], x2[suspect], xv[suspect]
+            if len(xv) == 0:
+                break
+            if level == maxLevel:
+                tangent.append(xv)
+                break
+            x = x0[:, None] + (x2 - x0)[:, None] * np.linspace(0, 1, refine + 1)
+            y = f(x)
+            roots.append(x[:, 1:-1][y[:, 1:-1] == 0])
+        if tangent:
+            xv = tangent[0]
+            roots.append(xv[np.abs(f(xv)) <= self.err])
+        left, right = np.concatenate(left), np.concatenate(right)
+        if len(left):
+            x, it, conv = self.Chandrupatla(left, right)
+            roots.append(x)
+        return np.unique(np.concatenate(roots))
+
+
+
+class NonlinearSystem():
+    """ Root finder for system of nonlinear equations F(x) = 0 where x and 
+    F(x) are 1-D arrays. Newton steps are taken with analytic or finite 
+    difference Jacobian, and LU factorization of Jacobian reused. Broyden 
+    method updates inverse of factorized Jacobian with rank-1 updates 
+    instead of re-forming it every iteration. Both methods use 
+    backtracking line search on ||F||^2.
+
+        @ Methods : 
+        - Newton
+        - Broyden
+
+        @ Note : 
+        Before use the methods, you need to set some parameters.
+        To do it, you can call `@setParams` method.
+
+        @ Usage :
+        ...
+        def F(x):
+            return np.array([x[0]**2 + x[1]**2 - 4, x[0] - x[1]])
+        
+        ns = NonlinearSystem()
+        ns.setParams(F)
+        result = ns.Broyden([1., 0.5])
+        result.root
+        ...
+     """
+
+    def setParams(self, func=None, jac=None, err=1e-10, xtol=1e-12, maxIt=100):
+        """ To find root, you need to set some properties.
+        
+        Arguments :
+        -------------
+
+        func : Target function which argument is array 'x' and returns 
+        array F(x).
+
+        jac : Jacobian function which returns matrix dF_i / dx_j. If it is 
+        None, forward finite difference used.
+
+        err : Desired error of max |F(x)|. Default equal 1e-10.
+
+        xtol : Iteration stops when max |step| <= xtol * (1 + max |x|). 
+        Default equal 1e-12.
+
+        maxIt : Maximum iteration number. Default equal 100.
+
+        """
+        self.func = func
+        self.jac = jac
+        self.err = err
+        self.xtol = xtol
+        self.maxIt = maxIt
+
+    def __call(self, x):
+        return np.asarray(self.func(x), dtype=np.float64).ravel()
+
+    def __jacobian(self, x, f):
+        if self.jac != None:
+            return np.atleast_2d(np.asarray(self.jac(x), dtype=np.float64)), 0
+        n = len(x)
+        J = np.empty((len(f), n))
+        h = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(x), 1.)
+        for j in range(n):
+            xh = x.copy()
+            xh[j] += h[j]
+            J[:, j] = (self.__call(xh) - f) / (xh[j] - x[j])
+        return J, n
+
+    def __solve(self, x0, broyden, maxUpdates):
+        try:
+            from scipy.linalg import lu_factor, lu_solve
+        except ImportError:
+            # without scipy, Jacobian is kept and solved again each time.
+            lu_factor = lambda J: J
+            lu_solve = lambda J, v: np.linalg.solve(J, v)
+        if self.func == None:
+            raise Exception("Function (func) should be declared in setParams.")
+        x = np.array(x0, dtype=np.float64).ravel()
+        f = self.__call(x)
+        calls = 1
+        if maxUpdates == None:
+            maxUpdates = max(10, len(x))
+        # inverse Jacobian in product form : (I + a_k s_k^T) ... (I + a_0 s_0^T) (LU)^-1
+        lu, A, S, fresh = None, [], [], False
+        def apply(v):
+            w = lu_solve(lu, v)
+            for a, s in zip(A, S):
+                w += a * np.dot(s, w)
+            return w
+        g0 = np.dot(f, f)
+        for it in range(1, self.maxIt + 1):
+            if np.max(np.abs(f)) <= self.err:
+                return RootResults(x, it - 1, calls, True)
+            if lu is None or not fresh and (not broyden or len(S) >= maxUpdates):
+                J, c = self.__jacobian(x, f)
+                calls += c
+                lu, A, S, fresh = lu_factor(J), [], [], True
+            p = -apply(f)
+            lam = 1.
+            while True:
+                xn = x + lam * p
+                fn = self.__call(xn)
+                calls += 1
+                g = np.dot(fn, fn)
+                if g <= (1 - 2e-4 * lam) * g0:
+                    break
+                if lam < 1e-4:
+                    lam = 0.
+                    break
+                if np.isfinite(g):
+                    lam = min(max(g0 * lam * lam / (g - g0 + 2 * g0 * lam), 0.1 * lam), 0.5 * lam)
+                else:
+                    lam *= 0.1
+            if lam == 0.:
+                if fresh:
+                    return RootResults(x, it, calls, False)
+                lu = None
+                continue
+            s, y = xn - x, fn - f
+            x, f, g0 = xn, fn, g
+            if np.max(np.abs(s)) <= self.xtol * (1 + np.max(np.abs(x))):
+                return RootResults(x, it, calls, np.max(np.abs(f)) <= self.err)
+            fresh = False
+            if broyden and len(S) < maxUpdates:
+                Hy = apply(y)
+                denom = np.dot(s, Hy)
+                if denom != 0 and np.isfinite(denom):
+                    A.append((s - Hy) / denom)
+                    S.append(s)
+                else:
+                    lu = None
+        return RootResults(x, self.maxIt, calls, np.max(np.abs(f)) <= self.err)
+
+    def Newton(self, x0):
+        """ Newton method. Jacobian formed and factorized every iteration.
+
+        Arguments :
+        -----------
+        
+        x0 : Initial guess array. 
+
+        Return :
+        --------
+        result : RootResults which has root, iterations, funcCalls and 
+        converged.
+
+        """
+        return self.__solve(x0, False, 0)
+
+    def Broyden(self, x0, maxUpdates=None):
+        """ Broyden method. Jacobian formed and factorized once, then 
+        rank-1 updates applied to its inverse. Jacobian formed again after 
+        `maxUpdates` updates or when line search fails.
+
+        Arguments :
+        -----------
+        
+        x0 : Initial guess array. \n
+        maxUpdates : Maximum number of rank-1 updates before new Jacobian.
+        Default equal max(10, len(x0)).
+
+        Return :
+        --------
+        result : RootResults which has root, iterations, funcCalls and 
+        converged.
+
+        """
+        return self.__solve(x0, True, maxUpdates)
+
+
+
+class PolynomialRoots():
+    """ All (complex) roots of polynomials. Coefficients are in ascending 
+    order like `PolynomialRegression.results()`, f(x) = a0 + a1x + ...
+    Batch of polynomials with same degree can be given as 2-D array which 
+    each row is coefficients of one polynomial, then roots of all of them 
+    found at once.
+
+    Arguments :
+    -------------
+        coefficients = Coefficients array. 1-D for one polynomial or 2-D 
+        (nPolynomials, degree + 1) for batch.
+
+        @ Methods : 
+        - Companion : Eigenvalues of balanced companion matrices.
+        - Aberth : Aberth - Ehrlich iteration vectorized over batch.
+
+        @ Usage :
+        ...
+        cf = PolynomialRegression(xValues, yValues, 3)
+        roots = PolynomialRoots(cf.results()).Companion()
+        
+        coeff = np.random.rand(1000, 6)
+        roots, converged = PolynomialRoots(coeff).Aberth()
+        ...
+     """
+    def __init__(self, coefficients):
+        a = np.asarray(coefficients)
+        self._single = a.ndim == 1
+        a = np.atleast_2d(a)
+        a = a.astype(np.complex128 if np.iscomplexobj(a) else np.float64)
+        # drop highest order terms which are zero for all polynomials
+        nonzero = np.flatnonzero(np.any(a != 0, axis=0))
+        if len(nonzero) == 0:
+            raise Exception("All coefficients are zero.")
+        a = a[:, :nonzero[-1] + 1]
+        if np.any(a[:, -1] == 0):
+            raise Exception("Leading coefficients should be nonzero for all polynomials.")
+        self._a = a / a[:, -1:]
+        self._degree = a.shape[1] - 1
+
+    def __shape(self, roots):
+        return roots[0] if self._single else roots
+
+    def Companion(self):
+        """ Roots from eigenvalues of companion matrices. Matrices are 
+        balanced by LAPACK before eigenvalues computed.
+
+        Return :
+        --------
+        roots : Complex array, (degree,) or (nPolynomials, degree).
+
+        """
+        m, n = self._a.shape[0], self._degree
+        C = np.zeros((m, n, n), dtype=self._a.dtype)
+        C[:, 0, :] = -self._a[:, -2::-1]
+        C[:, np.arange(1, n), np.arange(n - 1)] = 1
+        return self.__shape(np.linalg.eigvals(C) if n else np.empty((m, 0)))
+
+    def Aberth(self, maxIt=100, tol=4*np.finfo(float).eps, init=None):
+        """ Aberth - Ehrlich iteration. All roots of all polynomials updated 
+        together, converged roots are not updated again. 
+
+        Arguments :
+        -----------
+        
+        maxIt : Maximum iteration number. Default equal 100. \n
+        tol : Root converged when |correction| <= tol * |root| or |p(root)|
+        is in rounding error level. \n
+        init : Initial guesses with shape of roots. For example roots of 
+        previous, close polynomials. Default guesses are on circle with 
+        radius of geometric mean of root magnitudes.
+
+        Return :
+        --------
+        roots, converged : Complex roots array, (degree,) or 
+        (nPolynomials, degree), and convergence flags of polynomials.
+
+        """
+        a, n = self._a, self._degree
+        m = a.shape[0]
+        if init is None:
+            radius = np.abs(a[:, :1])**(1. / max(n, 1))
+            radius[radius == 0] = 1.
+            z = radius * np.exp(1j * (2 * np.pi * np.arange(n) / max(n, 1) + 0.4))
+        else:
+            z = np.array(np.broadcast_to(init, (m, n)), dtype=np.complex128)
+        done = np.zeros((m, n), dtype=bool)
+        active = np.arange(m)
+        off = ~np.eye(n, dtype=bool)
+        for it in range(maxIt):
+            if len(active) == 0:
+                break
+            za, aa = z[active], a[active]
+            p = np.ones_like(za)
+            dp = np.zeros_like(za)
+            # bound of rounding error of p(z) for stopping
+            r, bound = np.abs(za), np.ones(za.shape)
+            for k in range(n - 1, -1, -1):
+                dp = dp * za + p
+                p = p * za + aa[:, k:k + 1]
+                bound = bound * r + np.abs(aa[:, k:k + 1])
+            with np.errstate(divide='ignore', invalid='ignore'):
+                ratio = p / dp
+                D = za[:, :, None] - za[:, None, :]
+                S = np.sum(np.where(off, 1 / np.where(off, D, 1), 0), axis=-1)
+                w = ratio / (1 - ratio * S)
+            w[p == 0] = 0
+            ok = np.isfinite(w)
+            w[~ok] = 0
+            conv = ((np.abs(w) <= tol * r) | (np.abs(p) <= 4 * np.finfo(float).eps * bound)) & ok
+            # converged roots are frozen
+            conv |= done[active]
+            w[conv] = 0
+            z[active] = za - w
+            done[active] = conv
+            keep = ~np.all(conv, axis=1)
+            active = active[keep]
+        return self.__shape(z), self.__shape(np.all(done, axis=1))
+
@@ -3,35 +3,169 @@ Author  : Mehmet Gokcay Kabatas
 Mail    : mgokcaykdev@gmail.com
 Version : 0.1
 Date    : 11/12/2019
-Update  : 14/12/2019
+Update  : 19/10/2026
 Python  : 3.6.5
 
-Update Note : Adding descriptions.
+Update Note : Adding StatisticsAccumulator, helper functions computed
+              with it in single pass.
 
 This script written by @Author for personal usage. 
 
+Prerequest : numpy
+
 """
+import numpy as np
+
+class StatisticsAccumulator():
+    """
+    This class written for single pass statistics of data. Data is reduced
+    to count, mean, sum of squared deviations (M2), min, max and optionally
+    third and fourth central moments chunk by chunk with vectorized sums
+    and numerically stable (Welford/Chan) update. Accumulators of parallel
+    workers can be merged.
+
+    Arguments :
+        -------------
+        higherMoments = Keep third and fourth moments for skewness and
+        kurtosis. Default is False.
+
+    \n Class has 2 update methods. \n
+        - partial_fit(values) : Add chunk of data or iterator of chunks.
+        - merge(other) : Add statistics of other accumulator.
+
+        @Usage :
+        ...
+        stats = StatisticsAccumulator()
+        stats.partial_fit(chunk1).partial_fit(chunk2)
+        stats.partial_fit(chunkIterator)
+        stats.merge(otherStats)
+        mean, var = stats.mean(), stats.variance()
+        ...
+
+    """
+    def __init__(self, higherMoments=False):
+        self._higher = higherMoments
+        self._n = 0
+        self._mean = 0.
+        self._M2 = 0.
+        self._M3 = 0.
+        self._M4 = 0.
+        self._min = np.inf
+        self._max = -np.inf
+
+    def __combine(self, n, mean, M2, M3, M4, min, max):
+        if n == 0:
+            return
+        na, total = self._n, self._n + n
+        d = mean - self._mean
+        dn = d / total
+        if self._higher:
+            self._M4 += (M4 + d * dn**3 * na * n * (na * na - na * n + n * n)
+                         + 6 * dn * dn * (na * na * M2 + n * n * self._M2)
+                         + 4 * dn * (na * M3 - n * self._M3))
+            self._M3 += (M3 + d * dn * dn * na * n * (na - n)
+                         + 3 * dn * (na * M2 - n * self._M2))
+        self._M2 += M2 + d * dn * na * n
+        self._mean += dn * n
+        self._min = min if min < self._min else self._min
+        self._max = max if max > self._max else self._max
+        self._n = total
+
+    def partial_fit(self, values):
+        """
+        This function add chunk of data to accumulator. If values is
+        iterator (ex: generator) each item of it is added as a chunk.
+
+        Arguments :
+        -------------
+            values = chunk of data or iterator of chunks.
+
+        Return :
+        --------
+                Accumulator itself.
+        """
+        if hasattr(values, '__next__'):
+            for chunk in values:
+                self.partial_fit(chunk)
+            return self
+        x = np.asarray(values, dtype=np.float64).ravel()
+        if len(x) == 0:
+            return self
+        mean = x.mean()
+        d = x - mean
+        d2 = d * d
+        M3 = M4 = 0.
+        if self._higher:
+            M3 = np.dot(d2, d)
+            M4 = np.dot(d2, d2)
+        self.__combine(len(x), mean, d2.sum(), M3, M4, x.min(), x.max())
+        return self
+
+    def merge(self, other):
+        """
+        This function add statistics of other accumulator, ex: accumulator
+        of other worker.
+
+        Arguments :
+        -------------
+            other = other accumulator.
+
+        Return :
+        --------
+                Accumulator itself.
+        """
+        if self._higher and not other._higher:
+            raise Exception("Other accumulator should keep higher moments.")
+        self.__combine(other._n, other._mean, other._M2, other._M3, other._M4,
+                       other._min, other._max)
+        return self
+
+    def count(self):
+        return self._n
+
+    def mean(self):
+        if self._n == 0:
+            raise Exception("Mean need at least one data.")
+        return self._mean
+
+    def min(self):
+        return self._min
+
+    def max(self):
+        return self._max
+
+    def variance(self, ddof=1):
+        """ Variance of data. Default is sample variance (ddof=1). """
+        if self._n <= ddof:
+            raise Exception("Variance need more data than ddof.")
+        return self._M2 / (self._n - ddof)
+
+    def standartDeviation(self, ddof=1):
+        return self.variance(ddof)**(0.5)
+
+    def coeffOfVariation(self):
+        return self.standartDeviation() / self._mean * 100
+
+    def skewness(self):
+        """ Skewness of data. Need higherMoments. """
+        if not self._higher:
+            raise Exception("Skewness need accumulator with higherMoments.")
+        return self._n**(0.5) * self._M3 / self._M2**(1.5)
+
+    def kurtosis(self):
+        """ Excess kurtosis of data. Need higherMoments. """
+        if not self._higher:
+            raise Exception("Kurtosis need accumulator with higherMoments.")
+        return self._n * self._M4 / self._M2**2 - 3
+
 def arithmaticMean(values):
-    sum = 0
-    for item in values:
-        sum += item
-    return sum/len(values)
+    return StatisticsAccumulator().partial_fit(values).mean()
 
 def variance(values):
-    sumYi = 0
-    sumYiSq = 0
-    for item in values:
-        sumYiSq += item**2
-        sumYi += item
-    var = sumYiSq - sumYi**2 / len(values)
-    var /= (len(values) - 1)
-    return var
+    return StatisticsAccumulator().partial_fit(values).variance()
 
 def standartDeviation(values):
     return variance(values)**(0.5)
 
 def coeffOfVariation(values):
-    sy = standartDeviation(values)
-    yBar = arithmaticMean(values)
-    return sy/yBar * 100
-
+    return StatisticsAccumulator().partial_fit(values).coeffOfVariation()